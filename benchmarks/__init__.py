@@ -0,0 +1 @@
+# This file was left empty on purpose.
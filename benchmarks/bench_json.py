@@ -0,0 +1,148 @@
+"""Compare the JSON decoder backends on synthetic stock list, transactions and chart responses.
+
+Run from the repository root with `python -m benchmarks.bench_json [number of items]`. The backends that are not
+installed are skipped, the typed backend decodes the items straight into msgspec structures like the `type_`
+argument of the client does.
+"""
+import json
+import random
+import sys
+import timeit
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from degiroapi.json_decoder import envelope_decoder, get_decoder
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+
+def synthetic_stock_list(items: int, seed: int = 0) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    products = [
+        {
+            "id": str(1000000 + item),
+            "name": f"Product {item}",
+            "isin": f"NL{rng.randrange(10 ** 10):010d}",
+            "symbol": f"P{item}",
+            "currency": rng.choice(["EUR", "USD", "GBP"]),
+            "productType": "STOCK",
+            "tradable": True,
+            "closePrice": round(rng.uniform(1, 500), 2),
+            "closePriceDate": "2026-10-16",
+            "exchangeId": str(rng.choice([194, 196, 200])),
+        }
+        for item in range(items)
+    ]
+    return {"offset": 0, "total": items, "products": products}
+
+
+def synthetic_transactions(items: int, seed: int = 0) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    data = [
+        {
+            "id": 50000000 + item,
+            "productId": rng.randrange(1000000, 1000000 + items),
+            "date": "2026-10-16T10:00:00+02:00",
+            "buysell": rng.choice(["B", "S"]),
+            "price": round(rng.uniform(1, 500), 2),
+            "quantity": rng.randint(1, 100),
+            "total": round(rng.uniform(-5000, 5000), 2),
+            "orderTypeId": 0,
+            "counterParty": "MK",
+            "transfered": False,
+            "fxRate": 1.0,
+            "totalInBaseCurrency": round(rng.uniform(-5000, 5000), 2),
+            "feeInBaseCurrency": -2.0,
+            "totalPlusFeeInBaseCurrency": round(rng.uniform(-5000, 5000), 2),
+            "transactionTypeId": 0,
+            "tradingVenue": "XAMS",
+        }
+        for item in range(items)
+    ]
+    return {"data": data}
+
+
+def synthetic_chart(items: int, seed: int = 0) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    series = [
+        {
+            "type": "time",
+            "times": "2026-10-16T09:00:00/PT1M",
+            "expires": "2026-10-16T17:30:00+02:00",
+            "data": [[minute, round(rng.uniform(1, 500), 4)] for minute in range(items)],
+            "id": "price:issueid:360148977",
+        }
+    ]
+    return {"requestid": "1", "start": "2026-10-16T00:00:00", "end": "2026-10-16T23:59:59", "series": series}
+
+
+def _structs() -> Dict[str, Tuple[str, Any]]:
+    """The msgspec structures of the typed backend, by payload, with the field of the response they decode."""
+
+    class StockListProduct(msgspec.Struct):
+        id: str
+        name: str
+        isin: str
+        symbol: str
+        currency: str
+        closePrice: Optional[float] = None
+
+    class Transaction(msgspec.Struct):
+        id: int
+        productId: int
+        date: str
+        buysell: str
+        price: float
+        quantity: int
+        total: float
+
+    class Series(msgspec.Struct):
+        id: str
+        type: str
+        data: List[List[float]]
+
+    return {
+        "stock list": ("products", StockListProduct),
+        "transactions": ("data", Transaction),
+        "chart": ("series", Series),
+    }
+
+
+def main(items: int = 20000, repeat: int = 5) -> None:
+    payloads = {
+        "stock list": json.dumps(synthetic_stock_list(items)).encode(),
+        "transactions": json.dumps(synthetic_transactions(items)).encode(),
+        "chart": json.dumps(synthetic_chart(items)).encode(),
+    }
+    backends: List[Tuple[str, Callable[[str], Callable[[bytes], Any]]]] = []
+    for backend in ("json", "orjson", "msgspec"):
+        try:
+            decoder = get_decoder(backend)
+        except ImportError:
+            print(f"{backend} is not installed, skipped")
+            continue
+        backends.append((backend, _same_decoder(decoder)))
+    if msgspec is not None:
+        structs = _structs()
+        backends.append(("msgspec typed", lambda payload: envelope_decoder(*structs[payload])))
+
+    print(f"{items} items, best of {repeat}")
+    for payload, content in payloads.items():
+        for label, decoder_of in backends:
+            decode = decoder_of(payload)
+            best = _best(lambda: decode(content), repeat)
+            print(f"{payload:<14} {label:<14} {len(content) / 1e6:>6.2f}MB {best * 1000:>8.2f}ms")
+
+
+def _same_decoder(decoder: Callable[[bytes], Any]) -> Callable[[str], Callable[[bytes], Any]]:
+    return lambda payload: decoder
+
+
+def _best(func: Callable[[], Any], repeat: int) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
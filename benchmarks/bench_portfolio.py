@@ -0,0 +1,110 @@
+"""Compare the portfolio parsers on a synthetic portfolio, against the parser they replaced.
+
+Run from the repository root with `python -m benchmarks.bench_portfolio [number of rows]`.
+"""
+import random
+import sys
+import timeit
+from typing import Any, Callable, List, Mapping
+
+from degiroapi.degiro import DeGiro
+from degiroapi.position import parse_positions
+
+# The cells DeGiro returns for each row of the portfolio.
+_CELLS = (
+    "id",
+    "positionType",
+    "size",
+    "price",
+    "value",
+    "accruedInterest",
+    "plBase",
+    "todayPlBase",
+    "portfolioValueCorrection",
+    "breakEvenPrice",
+    "averageFxRate",
+    "realizedProductPl",
+    "realizedFxPl",
+    "todayRealizedProductPl",
+    "todayRealizedFxPl",
+)
+
+
+def synthetic_portfolio(rows: int, seed: int = 0) -> Mapping:
+    """Build a portfolio update with `rows` positions, of which about a third have a size of 0."""
+    rng = random.Random(seed)
+    value = []
+    for row in range(rows):
+        size = 0.0 if rng.random() < 0.3 else float(rng.randint(1, 500))
+        cells = {
+            "id": str(100000 + row),
+            "positionType": "PRODUCT",
+            "size": size,
+            "price": round(rng.uniform(1, 500), 2),
+            "breakEvenPrice": round(rng.uniform(1, 500), 2),
+        }
+        value.append(
+            {
+                "name": "positionrow",
+                "id": str(100000 + row),
+                "value": [{"name": name, "value": cells.get(name, rng.random())} for name in _CELLS],
+            }
+        )
+    return {"portfolio": {"lastUpdated": 1, "name": "portfolio", "value": value}}
+
+
+def previous_filter_portfolio(portfolio: Mapping, filter_zero: bool = False) -> List[Mapping]:
+    """The parser before the single pass rewrite, kept here as the baseline."""
+    data: List[Mapping] = []
+    for item in portfolio["portfolio"]["value"]:
+        position_type = size = price = value = break_even_price = None
+        for i in item["value"]:
+            size = i["value"] if i["name"] == "size" else size
+            position_type = i["value"] if i["name"] == "positionType" else position_type
+            price = i["value"] if i["name"] == "price" else price
+            value = i["value"] if i["name"] == "value" else value
+            break_even_price = i["value"] if i["name"] == "breakEvenPrice" else break_even_price
+        data.append(
+            {
+                "id": item["id"],
+                "positionType": position_type,
+                "size": size,
+                "price": price,
+                "value": value,
+                "breakEvenPrice": break_even_price,
+            }
+        )
+    if filter_zero:
+        data_non_zero: List[Mapping] = []
+        for d in data:
+            if d["size"] != 0.0:
+                data_non_zero.append(d)
+        return data_non_zero
+    else:
+        return data
+
+
+def main(rows: int = 10000, repeat: int = 5) -> None:
+    portfolio = synthetic_portfolio(rows)
+    parsers: List[Any] = [
+        ("previous filter_portfolio", previous_filter_portfolio),
+        ("filter_portfolio", DeGiro.filter_portfolio),
+        ("parse_positions", parse_positions),
+    ]
+    expected = previous_filter_portfolio(portfolio, True)
+    assert DeGiro.filter_portfolio(portfolio, True) == expected
+    assert [position.to_dict() for position in parse_positions(portfolio, True)] == expected
+
+    print(f"{rows} rows, best of {repeat}")
+    for filter_zero in (False, True):
+        for label, parse in parsers:
+            best = _best(lambda: parse(portfolio, filter_zero), repeat)
+            print(f"{label:<28} filter_zero={filter_zero!s:<5} {best * 1000:>8.2f}ms")
+
+
+def _best(func: Callable[[], Any], repeat: int) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,82 @@
+"""Compare one product_info call per id with the chunked products_info against a local mock server.
+
+Run from the repository root with `python -m benchmarks.bench_products_info [number of ids]`.
+"""
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from typing import Any
+
+import requests
+
+from degiroapi.client_info import ClientInfo
+from degiroapi.degiro import DeGiro
+from degiroapi.product_cache import ProductCache
+from degiroapi.transport import RequestsTransport
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _ProductInfoHandler(BaseHTTPRequestHandler):
+    """Answers product info requests like DeGiro, counting the round-trips."""
+
+    round_trips = 0
+
+    def do_POST(self) -> None:
+        _ProductInfoHandler.round_trips += 1
+        ids = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        body = json.dumps({"data": {i: {"id": i, "name": f"Product {i}", "vwdId": i} for i in ids}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+class _LocalTransport(RequestsTransport):
+    """Sends the requests for DeGiro to the local mock server instead."""
+
+    def __init__(self, base_url: str):
+        super().__init__(requests.Session())
+        self.base_url = base_url
+
+    def send(self, method: str, url: str, **kwargs: Any) -> Any:
+        return super().send(method, url.replace("https://trader.degiro.nl", self.base_url), **kwargs)
+
+
+def _client(base_url: str) -> DeGiro:
+    degiro = DeGiro(product_cache=ProductCache(), transport=_LocalTransport(base_url))
+    degiro.session_id = "session"
+    degiro.client_info = ClientInfo({"intAccount": 1})
+    return degiro
+
+
+def main(count: int = 2000) -> None:
+    server = _ThreadingHTTPServer(("127.0.0.1", 0), _ProductInfoHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    ids = [str(product_id) for product_id in range(1, count + 1)]
+
+    def run(label: str, fetch: Any) -> None:
+        _ProductInfoHandler.round_trips = 0
+        started = time.perf_counter()
+        fetch(_client(base_url))
+        elapsed = time.perf_counter() - started
+        print(f"{label:<32} {_ProductInfoHandler.round_trips:>6} round-trips {elapsed:>8.3f}s")
+
+    run("product_info per id", lambda degiro: [degiro.product_info(product_id) for product_id in ids])
+    for chunk_size in (100, DeGiro.PRODUCT_INFO_CHUNK_SIZE):
+        run(f"products_info chunk_size={chunk_size}", lambda degiro: degiro.products_info(ids, chunk_size))
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
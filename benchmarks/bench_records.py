@@ -0,0 +1,84 @@
+"""Compare the memory and construction time of Product records with the Product class they replaced.
+
+Run from the repository root with `python -m benchmarks.bench_records [number of products]`.
+"""
+import datetime
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, List, Mapping, Optional
+
+from degiroapi.product import Product
+
+
+class PreviousProduct:
+    """The Product class before it became a slotted record, kept here as the baseline."""
+
+    def __init__(self, product: Mapping[str, str]):
+        self.__id = product["id"]
+        self.__name = product["name"]
+        self.__isin = product["isin"]
+        self.__symbol = product["symbol"]
+        self.__currency = product["currency"]
+        self.__product_type = product["productTypeId"]
+        self.__tradable = product["tradable"]
+        self.__close_price = product.get("closePrice")
+        cpd = product.get("closePriceDate")
+        self.__close_price_date = datetime.datetime.strptime(cpd, "%Y-%m-%d").date() if cpd else None
+
+    @property
+    def close_price_date(self) -> Optional[datetime.date]:
+        return self.__close_price_date
+
+
+def synthetic_products(count: int) -> List[Mapping[str, Any]]:
+    """Build product dicts with the fields of a product search result."""
+    return [
+        {
+            "id": str(1000000 + number),
+            "name": f"Product {number}",
+            "isin": f"US{number:010d}",
+            "symbol": f"P{number}",
+            "contractSize": 1.0,
+            "productType": "STOCK",
+            "productTypeId": 1,
+            "tradable": True,
+            "category": "B",
+            "currency": "USD",
+            "exchangeId": "663",
+            "onlyEodPrices": False,
+            "orderTimeTypes": ["DAY", "GTC"],
+            "buyOrderTypes": ["LIMIT", "MARKET", "STOPLOSS", "STOPLIMIT"],
+            "sellOrderTypes": ["LIMIT", "MARKET", "STOPLOSS", "STOPLIMIT"],
+            "closePrice": 42.5,
+            "closePriceDate": "2021-06-30",
+            "feedQuality": "R",
+            "vwdId": str(number),
+            "vwdIdentifierType": "issueid",
+        }
+        for number in range(count)
+    ]
+
+
+def measure(label: str, build: Callable[[], List[Any]]) -> None:
+    """Time a build without tracing, then trace the memory it allocates in a second build."""
+    started = time.perf_counter()
+    records = build()
+    elapsed = time.perf_counter() - started
+    del records
+    tracemalloc.start()
+    records = build()
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"{label:<38} {elapsed * 1000:>8.1f}ms {allocated / 2**20:>6.1f} MiB for {len(records)} records")
+
+
+def main(count: int = 100000) -> None:
+    raws = synthetic_products(count)
+    measure("previous Product", lambda: [PreviousProduct(raw) for raw in raws])
+    measure("Product.from_list", lambda: Product.from_list(raws))
+    measure("Product.from_list + close_price_date", lambda: [p for p in Product.from_list(raws) if p.close_price_date])
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,154 @@
+"""The fixtures of the pytest-benchmark suite, which replays a synthetic cassette so that it runs fully offline.
+
+Run from the repository root with `python -m pytest benchmarks`. The cassette is recorded once per session from a fake
+DeGiro that answers with synthetic data, through the RecordingTransport, and every benchmark replays it.
+"""
+import datetime
+import json
+import random
+from typing import Any, Dict, List, Mapping
+
+import pytest
+
+from degiroapi.data_type import DataType
+from degiroapi.degiro import DeGiro
+from degiroapi.interval_type import IntervalType
+from degiroapi.order_type import OrderType
+from degiroapi.transport import RecordedResponse, RecordingTransport, ReplayTransport, Transport
+
+try:
+    import pytest_benchmark
+except ImportError:  # pragma: no cover
+    pytest_benchmark = None
+
+if pytest_benchmark is None:
+    collect_ignore_glob = ["test_*.py"]
+
+USERNAME = "benchmark-user"
+PASSWORD = "benchmark-password"
+PRODUCT_ID = "1000000"
+PRODUCTS = 1000
+POSITIONS = 1000
+TRANSACTIONS = 2000
+ORDERS = 2000
+# Half a year, which the orders are fetched for in two windows and the transactions in one.
+WINDOW = (datetime.datetime(2026, 1, 1), datetime.datetime(2026, 6, 30))
+
+
+class FakeDeGiro(Transport):
+    """Answers the requests of a client with synthetic data, like DeGiro would."""
+
+    def __init__(self, seed: int = 0):
+        self.__rng = random.Random(seed)
+
+    def send(self, method: str, url: str, **kwargs: Any) -> Any:
+        headers = {"Content-Type": "application/json", "Set-Cookie": "JSESSIONID=fake-session; Path=/"}
+        return RecordedResponse(200, json.dumps(self.__answer(url, kwargs)).encode(), headers)
+
+    def __answer(self, url: str, kwargs: Mapping[str, Any]) -> Any:
+        rng = self.__rng
+        if "login/secure/login" in url:
+            return {"sessionId": "fake-session", "status": 0}
+        if "pa/secure/client" in url:
+            return {
+                "data": {
+                    "id": 1,
+                    "intAccount": 12345678,
+                    "username": USERNAME,
+                    "email": "benchmark@example.com",
+                    "firstContact": {"firstName": "Bench", "lastName": "Mark"},
+                }
+            }
+        if "login/secure/config" in url:
+            return {"data": {"clientId": 87654321}}
+        if "/update/" in url:
+            return synthetic_update(rng)
+        if "products/info" in url:
+            ids = json.loads(kwargs["data"])
+            return {
+                "data": {i: {"id": i, "name": f"Product {i}", "vwdIdentifierType": "issueid", "vwdId": i} for i in ids}
+            }
+        if "charting.vwdservices.com" in url:
+            data = [[minute, round(rng.uniform(1, 500), 4)] for minute in range(480)]
+            return {"series": [{"type": "time", "id": f"price:issueid:{PRODUCT_ID}", "data": data}]}
+        if "transactions" in url:
+            return {"data": [synthetic_transaction(rng, i) for i in range(TRANSACTIONS)]}
+        if "order-history" in url:
+            return {"data": [synthetic_order(rng, i) for i in range(ORDERS)]}
+        if "checkOrder" in url:
+            return {"data": {"confirmationId": "confirmation", "freeSpaceNew": 1000.0}}
+        if "/order/" in url:
+            return {"data": {"orderId": "order"}}
+        raise LookupError(f"The fake DeGiro does not answer {url}")
+
+
+def synthetic_update(rng: random.Random) -> Mapping:
+    rows = [
+        {
+            "name": "positionrow",
+            "id": str(100000 + row),
+            "value": [
+                {"name": "id", "value": str(100000 + row)},
+                {"name": "positionType", "value": "PRODUCT"},
+                {"name": "size", "value": 0.0 if rng.random() < 0.3 else float(rng.randint(1, 500))},
+                {"name": "price", "value": round(rng.uniform(1, 500), 2)},
+                {"name": "value", "value": round(rng.uniform(1, 50000), 2)},
+                {"name": "breakEvenPrice", "value": round(rng.uniform(1, 500), 2)},
+            ],
+        }
+        for row in range(POSITIONS)
+    ]
+    return {"portfolio": {"lastUpdated": 1, "name": "portfolio", "value": rows}}
+
+
+def synthetic_transaction(rng: random.Random, index: int) -> Dict[str, Any]:
+    return {
+        "id": 50000000 + index,
+        "productId": rng.randrange(1000000, 1000000 + PRODUCTS),
+        "date": "2026-10-16T10:00:00+02:00",
+        "buysell": rng.choice(["B", "S"]),
+        "price": round(rng.uniform(1, 500), 2),
+        "quantity": rng.randint(1, 100),
+        "total": round(rng.uniform(-5000, 5000), 2),
+    }
+
+
+def synthetic_order(rng: random.Random, index: int) -> Dict[str, Any]:
+    return {
+        "orderId": f"order-{index}",
+        "productId": rng.randrange(1000000, 1000000 + PRODUCTS),
+        "buysell": rng.choice(["B", "S"]),
+        "size": rng.randint(1, 100),
+        "price": round(rng.uniform(1, 500), 2),
+        "isActive": rng.random() < 0.2,
+    }
+
+
+@pytest.fixture(scope="session")
+def cassette(tmp_path_factory: pytest.TempPathFactory) -> List[Mapping]:
+    """Record every call of the suite once from the fake DeGiro, and load the cassette it was saved to."""
+    path = str(tmp_path_factory.mktemp("cassettes") / "degiro.json")
+    degiro = DeGiro(transport=RecordingTransport(FakeDeGiro(), path))
+    degiro.login(USERNAME, PASSWORD)
+    degiro.get_data(DataType.PORTFOLIO, True)
+    degiro.product_info(PRODUCT_ID)
+    degiro.real_time_price(int(PRODUCT_ID), IntervalType.One_Day)
+    degiro.transactions(*WINDOW)
+    degiro.orders(*WINDOW)
+    degiro.buy_order(OrderType.LIMIT, PRODUCT_ID, 3, 1, 10)
+    degiro.transport.save()  # type: ignore
+    with open(path) as file:
+        return json.load(file)
+
+
+@pytest.fixture
+def replay(cassette: List[Mapping]) -> DeGiro:
+    """A client that is not logged in, replaying the cassette."""
+    return DeGiro(transport=ReplayTransport(interactions=cassette))
+
+
+@pytest.fixture
+def degiro(replay: DeGiro) -> DeGiro:
+    """A client that is logged in, replaying the cassette."""
+    replay.login(USERNAME, PASSWORD)
+    return replay
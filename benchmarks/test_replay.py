@@ -0,0 +1,51 @@
+"""Benchmarks of the main calls of the client, replayed from a cassette so that only the client itself is measured."""
+from typing import Any
+
+from benchmarks.conftest import PASSWORD, PRODUCT_ID, USERNAME, WINDOW
+from degiroapi.data_type import DataType
+from degiroapi.degiro import DeGiro
+from degiroapi.interval_type import IntervalType
+from degiroapi.order_type import OrderType
+
+
+def test_login(benchmark: Any, replay: DeGiro) -> None:
+    benchmark(replay.login, USERNAME, PASSWORD)
+    assert replay.client_info.account_id == 0
+
+
+def test_get_update(benchmark: Any, degiro: DeGiro) -> None:
+    update = benchmark(degiro.get_update, {DataType.PORTFOLIO: 0})
+    assert update["portfolio"]["value"]
+
+
+def test_get_data_portfolio(benchmark: Any, degiro: DeGiro) -> None:
+    assert benchmark(degiro.get_data, DataType.PORTFOLIO, True)
+
+
+def test_filter_portfolio(benchmark: Any, degiro: DeGiro) -> None:
+    update = degiro.get_update({DataType.PORTFOLIO: 0})
+    assert benchmark(DeGiro.filter_portfolio, update, True)
+
+
+def test_product_info(benchmark: Any, degiro: DeGiro) -> None:
+    def product_info() -> Any:
+        degiro.product_cache.clear()
+        return degiro.product_info(PRODUCT_ID)
+
+    assert benchmark(product_info)["id"] == PRODUCT_ID
+
+
+def test_real_time_price(benchmark: Any, degiro: DeGiro) -> None:
+    assert benchmark(degiro.real_time_price, int(PRODUCT_ID), IntervalType.One_Day)
+
+
+def test_transactions(benchmark: Any, degiro: DeGiro) -> None:
+    assert benchmark(degiro.transactions, *WINDOW)
+
+
+def test_orders(benchmark: Any, degiro: DeGiro) -> None:
+    assert benchmark(degiro.orders, *WINDOW)
+
+
+def test_buy_order(benchmark: Any, degiro: DeGiro) -> None:
+    assert benchmark(degiro.buy_order, OrderType.LIMIT, PRODUCT_ID, 3, 1, 10) == "confirmation"
@@ -0,0 +1,257 @@
+import asyncio
+import datetime
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from degiroapi.client_info import ClientInfo
+from degiroapi.degiro import DeGiro
+from degiroapi.instrumentation import RequestHook
+from degiroapi.order_batch import CancelResult, OrderResult, OrderSpec
+from degiroapi.position import Position
+from degiroapi.price_result import PriceResult
+from degiroapi.product import Product
+from degiroapi.product_cache import ProductCache
+from degiroapi.rate_limiter import RateLimiter
+from degiroapi.single_flight import AsyncSingleFlight, flight_key
+from degiroapi.transport import Transport
+
+
+class AsyncDeGiro:
+    """Asyncio counterpart of DeGiro, which runs the calls of one shared DeGiro client concurrently.
+
+    All request building and response parsing is done by the wrapped DeGiro client. Its calls are executed on a pool
+    of at most `max_concurrency` threads which share a single connection pool of the same size. The other arguments
+    are passed on to the DeGiro client, like a `transport` to replay a cassette offline.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 10,
+        product_cache: Optional[ProductCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        json_backend: Optional[str] = None,
+        transport: Optional[Transport] = None,
+    ):
+        self.client = DeGiro(
+            product_cache=product_cache,
+            pool_size=max_concurrency,
+            rate_limiter=rate_limiter,
+            json_backend=json_backend,
+            transport=transport,
+        )
+        self.__executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        self.single_flight = AsyncSingleFlight()
+
+    @property
+    def session_id(self) -> Optional[str]:
+        return self.client.session_id
+
+    @property
+    def client_token(self) -> Optional[str]:
+        return self.client.client_token
+
+    @property
+    def client_info(self) -> Optional[ClientInfo]:
+        return self.client.client_info
+
+    async def __aenter__(self) -> "AsyncDeGiro":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    def close(self) -> None:
+        """Wait for the calls that are still running, then close the connection pool."""
+        self.__executor.shutdown(wait=True)
+        self.client.session.close()
+
+    async def __run(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.__executor, functools.partial(func, *args, **kwargs))
+
+    async def __iterate(self, iterator: Iterator) -> AsyncIterator:
+        """Advance a blocking iterator of the client on the pool, one item at a time."""
+        done = object()
+        while True:
+            item = await self.__run(next, iterator, done)
+            if item is done:
+                return
+            yield item
+
+    async def __shared(self, func: Callable, *args: Any) -> Any:
+        """Run a read-only call like __run, letting identical concurrent calls wait for the first one."""
+        return await self.single_flight.do(flight_key(func.__name__, args), lambda: self.__run(func, *args))
+
+    def add_hook(self, hook: RequestHook) -> None:
+        self.client.add_hook(hook)
+
+    async def login(
+        self, username: str, password: str, totp: Optional[str] = None, session_file: Optional[str] = None
+    ) -> Mapping:
+        return await self.__run(self.client.login, username, password, totp, session_file)
+
+    async def save_session(self, session_file: str) -> None:
+        return await self.__run(self.client.save_session, session_file)
+
+    async def restore_session(self, session_file: str, username: Optional[str] = None) -> bool:
+        return await self.__run(self.client.restore_session, session_file, username)
+
+    async def logout(self) -> None:
+        return await self.__run(self.client.logout)
+
+    async def account_overview(
+        self, from_date: datetime.datetime, to_date: datetime.datetime, max_workers: int = 4
+    ) -> Union[List, Mapping]:
+        return await self.__shared(self.client.account_overview, from_date, to_date, max_workers)
+
+    async def get_exchange_rate(self, exchange: str) -> float:
+        return await self.__shared(self.client.get_exchange_rate, exchange)
+
+    async def search_products(self, search_text: str, limit: int = 1) -> List[Mapping]:
+        return await self.__shared(self.client.search_products, search_text, limit)
+
+    async def iter_search_products(
+        self, search_text: str, page_size: int = 100, prefetch: bool = True
+    ) -> AsyncIterator[Product]:
+        async for product in self.__iterate(self.client.iter_search_products(search_text, page_size, prefetch)):
+            yield product
+
+    async def products_info(
+        self, product_ids: Iterable[Union[int, str]], chunk_size: int = DeGiro.PRODUCT_INFO_CHUNK_SIZE
+    ) -> Dict[str, Mapping]:
+        return await self.__shared(self.client.products_info, list(product_ids), chunk_size)
+
+    async def product_info(self, product_id: Union[int, str]) -> Mapping:
+        return await self.__shared(self.client.product_info, product_id)
+
+    async def transactions(
+        self,
+        from_date: datetime.datetime,
+        to_date: datetime.datetime,
+        group_transactions: bool = False,
+        max_workers: int = 4,
+        type_: Any = None,
+    ) -> List[Mapping]:
+        return await self.__shared(self.client.transactions, from_date, to_date, group_transactions, max_workers, type_)
+
+    async def iter_transactions(
+        self,
+        from_date: datetime.datetime,
+        to_date: datetime.datetime,
+        group_transactions: bool = False,
+        type_: Any = None,
+    ) -> AsyncIterator[Mapping]:
+        transactions = self.client.iter_transactions(from_date, to_date, group_transactions, type_)
+        async for transaction in self.__iterate(transactions):
+            yield transaction
+
+    async def orders(
+        self,
+        from_date: datetime.datetime,
+        to_date: datetime.datetime,
+        not_executed: bool = False,
+        max_workers: int = 4,
+        type_: Any = None,
+    ) -> List[Mapping]:
+        return await self.__shared(self.client.orders, from_date, to_date, not_executed, max_workers, type_)
+
+    async def iter_orders(
+        self, from_date: datetime.datetime, to_date: datetime.datetime, type_: Any = None
+    ) -> AsyncIterator[Mapping]:
+        async for order in self.__iterate(self.client.iter_orders(from_date, to_date, type_)):
+            yield order
+
+    async def delete_order(self, order_id: str) -> Union[Mapping, List, str]:
+        return await self.__run(self.client.delete_order, order_id)
+
+    filter_cash_funds = staticmethod(DeGiro.filter_cash_funds)
+    filter_portfolio = staticmethod(DeGiro.filter_portfolio)
+
+    async def get_data(self, datatype: str, filter_zero: bool = False) -> List[Mapping]:
+        return await self.__shared(self.client.get_data, datatype, filter_zero)
+
+    async def get_positions(self, filter_zero: bool = False) -> List[Position]:
+        return await self.__shared(self.client.get_positions, filter_zero)
+
+    async def get_data_many(self, datatypes: Iterable[str], filter_zero: bool = False) -> Dict[str, Any]:
+        return await self.__shared(self.client.get_data_many, list(datatypes), filter_zero)
+
+    async def get_update(self, last_updated: Mapping[str, int]) -> Mapping:
+        return await self.__shared(self.client.get_update, last_updated)
+
+    async def vwd_identifier(self, product_id: Union[int, str]) -> Tuple[str, str]:
+        return await self.__shared(self.client.vwd_identifier, product_id)
+
+    async def vwd_identifiers(self, product_ids: Iterable[Union[int, str]]) -> Dict[str, Tuple[str, str]]:
+        return await self.__shared(self.client.vwd_identifiers, list(product_ids))
+
+    async def real_time_price(self, product_id: int, interval: str, type_: Any = None):
+        return await self.__shared(self.client.real_time_price, product_id, interval, type_)
+
+    async def real_time_prices(
+        self, product_ids: Iterable[Union[int, str]], interval: str, max_workers: int = 10
+    ) -> AsyncIterator[PriceResult]:
+        async for result in self.__iterate(self.client.real_time_prices(list(product_ids), interval, max_workers)):
+            yield result
+
+    async def combined_real_time_prices(
+        self, product_ids: Iterable[Union[int, str]], interval: str, batch_size: int = DeGiro.PRICE_DATA_BATCH_SIZE
+    ) -> Dict[str, List[Mapping]]:
+        return await self.__shared(self.client.combined_real_time_prices, list(product_ids), interval, batch_size)
+
+    async def buy_order(
+        self,
+        order_type: int,
+        product_id: str,
+        time_type: int,
+        size: int,
+        limit: Optional[Union[int, float]] = None,
+        stop_loss: Optional[Union[int, float]] = None,
+    ) -> str:
+        return await self.__run(self.client.buy_order, order_type, product_id, time_type, size, limit, stop_loss)
+
+    async def sell_order(
+        self,
+        order_type: int,
+        product_id: str,
+        time_type: int,
+        size: int,
+        limit: Optional[Union[int, float]] = None,
+        stop_loss: Optional[Union[int, float]] = None,
+    ) -> str:
+        return await self.__run(self.client.sell_order, order_type, product_id, time_type, size, limit, stop_loss)
+
+    async def place_orders(self, orders: Iterable[OrderSpec], max_workers: int = 10) -> List[OrderResult]:
+        return await self.__run(self.client.place_orders, list(orders), max_workers)
+
+    async def delete_orders(self, order_ids: Iterable[str], max_workers: int = 10) -> List[CancelResult]:
+        return await self.__run(self.client.delete_orders, list(order_ids), max_workers)
+
+    async def modify_order(
+        self,
+        order_type: int,
+        order_id: str,
+        product_id: str,
+        buy_sell: str,
+        time_type: int,
+        size: int,
+        limit: Optional[Union[int, float]] = None,
+    ) -> Mapping:
+        return await self.__run(
+            self.client.modify_order, order_type, order_id, product_id, buy_sell, time_type, size, limit
+        )
+
+    async def future_dividends(self) -> List[Mapping]:
+        return await self.__shared(self.client.future_dividends)
+
+    async def get_stock_list(self, index_id: int, stock_country_id: int, type_: Any = None) -> List[Mapping]:
+        return await self.__shared(self.client.get_stock_list, index_id, stock_country_id, type_)
+
+    async def iter_stock_list(
+        self, index_id: int, stock_country_id: int, page_size: int = 100, prefetch: bool = True
+    ) -> AsyncIterator[Product]:
+        async for product in self.__iterate(
+            self.client.iter_stock_list(index_id, stock_country_id, page_size, prefetch)
+        ):
+            yield product
@@ -1,32 +1,32 @@
-from typing import Mapping
+from typing import Any, Mapping
 
+from degiroapi.record import Record
 
-class ClientInfo:
+
+class ClientInfo(Record):
     """Data Class for the user currently authenticated with DeGiro."""
 
-    def __init__(self, client_info: Mapping):
-        self.__account_id: str = client_info["intAccount"]
-        self.__username: str = client_info["username"]
-        self.__first_name: str = client_info["firstContact"]["firstName"]
-        self.__last_name: str = client_info["firstContact"]["lastName"]
-        self.__email: str = client_info["email"]
+    __slots__ = ()
+
+    def __init__(self, client_info: Mapping[str, Any]):
+        super().__init__(client_info)
 
     @property
     def account_id(self) -> str:
-        return self.__account_id
+        return self.raw["intAccount"]
 
     @property
     def username(self) -> str:
-        return self.__username
+        return self.raw["username"]
 
     @property
     def first_name(self) -> str:
-        return self.__first_name
+        return self.raw["firstContact"]["firstName"]
 
     @property
     def last_name(self) -> str:
-        return self.__last_name
+        return self.raw["firstContact"]["lastName"]
 
     @property
     def email(self) -> str:
-        return self.__email
+        return self.raw["email"]
@@ -3,3 +3,8 @@ class DataType:
 
     PORTFOLIO = "portfolio"
     CASH_FUNDS = "cashFunds"
+    TOTAL_PORTFOLIO = "totalPortfolio"
+    ORDERS = "orders"
+    HISTORICAL_ORDERS = "historicalOrders"
+    TRANSACTIONS = "transactions"
+    ALERTS = "alerts"
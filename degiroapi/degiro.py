@@ -1,14 +1,39 @@
 import datetime
+import functools
 import json
-from typing import List, Mapping, Optional, Tuple, Union
+import os
+import threading
+import time
+from concurrent.futures import as_completed, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple, Type, Union
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from degiroapi.client_info import ClientInfo
 from degiroapi.data_type import DataType
-from degiroapi.exceptions import DeGiroRequiresTOTP
-from degiroapi.interval_type import IntervalType
+from degiroapi.exceptions import (
+    DeGiroConnectionError,
+    DeGiroRateLimited,
+    DeGiroRequestError,
+    DeGiroRequiresTOTP,
+    DeGiroServerError,
+    DeGiroSessionExpired,
+)
+from degiroapi.fx import ExchangeRates
+from degiroapi.instrumentation import RequestEvent, RequestHook
+from degiroapi.json_decoder import Decoder, envelope_decoder, get_decoder, VALIDATION_ERRORS
+from degiroapi.order_batch import CancelResult, OrderResult, OrderSpec
 from degiroapi.order_type import OrderType
+from degiroapi.position import parse_position_dicts, parse_positions, Position
+from degiroapi.price_result import PriceResult
+from degiroapi.product import Product
+from degiroapi.product_cache import ProductCache
+from degiroapi.rate_limiter import Priority, RateLimiter
+from degiroapi.retry_policy import NO_RETRY, NON_IDEMPOTENT, RetryPolicy
+from degiroapi.single_flight import flight_key, SingleFlight
+from degiroapi.transport import RequestsTransport, Transport
+from degiroapi.utils import field_of, iter_unique, split_date_range
 
 
 class DeGiro:
@@ -40,14 +65,122 @@ class DeGiro:
     __POST_REQUEST = 1
     __DELETE_REQUEST = 2
     __PUT_REQUEST = 3
+    __METHODS = {__GET_REQUEST: "GET", __POST_REQUEST: "POST", __DELETE_REQUEST: "DELETE", __PUT_REQUEST: "PUT"}
 
-    def __init__(self):
+    PRODUCT_INFO_CHUNK_SIZE = 1000
+    PRICE_DATA_BATCH_SIZE = 50
+    ORDERS_WINDOW_DAYS = 90
+    REPORTING_WINDOW_DAYS = 365
+
+    DEFAULT_RETRY_POLICY = RetryPolicy()
+    RETRY_POLICIES = {
+        "login": NO_RETRY,
+        "logout": NO_RETRY,
+        "confirm_order": NON_IDEMPOTENT,
+        "modify_order": NON_IDEMPOTENT,
+        "delete_order": NON_IDEMPOTENT,
+    }
+    # Endpoints whose requests are not replayed in a new session when DeGiro rejects their session.
+    __LOGIN_ENDPOINTS = ("login", "client_info", "config", "logout")
+    # Read-only endpoints, for which concurrent identical requests can share one response.
+    COALESCED_ENDPOINTS = frozenset(
+        {
+            "search_products",
+            "product_info",
+            "stock_list",
+            "account_overview",
+            "transactions",
+            "orders",
+            "future_dividends",
+            "update",
+            "price_data",
+        }
+    )
+
+    ENDPOINT_FAMILIES = {
+        "login": "login",
+        "client_info": "login",
+        "config": "login",
+        "logout": "login",
+        "search_products": "product_search",
+        "product_info": "product_search",
+        "stock_list": "product_search",
+        "account_overview": "reporting",
+        "transactions": "reporting",
+        "orders": "reporting",
+        "future_dividends": "reporting",
+        "update": "trading",
+        "check_order": "trading",
+        "confirm_order": "trading",
+        "modify_order": "trading",
+        "delete_order": "trading",
+        "price_data": "vwd",
+    }
+    ENDPOINT_PRIORITIES = {
+        "check_order": Priority.HIGH,
+        "confirm_order": Priority.HIGH,
+        "modify_order": Priority.HIGH,
+        "delete_order": Priority.HIGH,
+        "price_data": Priority.LOW,
+    }
+
+    def __init__(
+        self,
+        product_cache: Optional[ProductCache] = None,
+        pool_size: int = 10,
+        rate_limiter: Optional[RateLimiter] = None,
+        json_backend: Optional[str] = None,
+        transport: Optional[Transport] = None,
+    ):
         self.session = requests.Session()
+        self.__pool_size = 0
+        self.__ensure_pool_size(pool_size)
         self.client_token: Optional[str] = None
         self.session_id: Optional[str] = None
         self.client_info: Optional[ClientInfo] = None
+        self.product_cache = product_cache if product_cache is not None else ProductCache()
+        self.retry_policies: Dict[str, RetryPolicy] = dict(DeGiro.RETRY_POLICIES)
+        self.coalesced_endpoints: Set[str] = set(DeGiro.COALESCED_ENDPOINTS)
+        self.single_flight = SingleFlight()
+        self.exchange_rates = ExchangeRates(self)
+        self.rate_limiter = rate_limiter
+        self.json_loads = get_decoder(json_backend)
+        self.hooks: List[RequestHook] = []
+        self.transport = transport if transport is not None else RequestsTransport(self.session)
+        self.__credentials: Optional[Tuple[str, str]] = None
+        self.__session_file: Optional[str] = None
+        self.__login_lock = threading.Lock()
+
+    def add_hook(self, hook: RequestHook) -> None:
+        """Add a hook that observes every attempt of every request, like a MetricsCollector."""
+        self.hooks.append(hook)
 
-    def login(self, username: str, password: str, totp: Optional[str] = None) -> Mapping:
+    def __ensure_pool_size(self, pool_size: int) -> None:
+        """Make sure the session can keep at least `pool_size` connections per host open."""
+        if pool_size > self.__pool_size:
+            self.session.mount("https://", HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size))
+            self.__pool_size = pool_size
+
+    def login(
+        self, username: str, password: str, totp: Optional[str] = None, session_file: Optional[str] = None
+    ) -> Mapping:
+        """Log in to DeGiro.
+
+        The credentials are kept to log in again when the session expires. With a `session_file`, the session saved
+        in it for the same username is reused without any request. It is only checked on the first request, and when
+        it turns out to be expired a full login is done and saved to the file instead.
+        """
+        self.__credentials = (username, password)
+        self.__session_file = session_file
+        if session_file and self.restore_session(session_file, username):
+            return {"data": dict(self.client_info.raw)}
+
+        client_info_response = self.__login(username, password, totp)
+        if session_file:
+            self.save_session(session_file)
+        return client_info_response
+
+    def __login(self, username: str, password: str, totp: Optional[str] = None) -> Mapping:
         login_payload = {
             "username": username,
             "password": password,
@@ -64,6 +197,7 @@ class DeGiro:
                 login_payload,
                 request_type=DeGiro.__POST_REQUEST,
                 error_message="Could not login.",
+                endpoint="login",
             )
         except Exception as exc:
             if "totpNeeded" in str(exc):
@@ -73,7 +207,11 @@ class DeGiro:
         self.session_id = login_response["sessionId"]  # type: ignore
         client_info_payload = {"sessionId": self.session_id}
         client_info_response = self.__request(
-            DeGiro.__CLIENT_INFO_URL, None, client_info_payload, error_message="Could not get client info."
+            DeGiro.__CLIENT_INFO_URL,
+            None,
+            client_info_payload,
+            error_message="Could not get client info.",
+            endpoint="client_info",
         )
         self.client_info = ClientInfo(client_info_response["data"])  # type: ignore
 
@@ -84,22 +222,73 @@ class DeGiro:
             cookie=cookie,
             request_type=DeGiro.__GET_REQUEST,
             error_message="Could not get client config.",
+            endpoint="config",
         )
         self.client_token = client_token_response["data"]["clientId"]  # type: ignore
 
         return client_info_response  # type: ignore
 
+    def save_session(self, session_file: str) -> None:
+        """Save the authenticated session to a file that only the current user can read."""
+        state = {
+            "username": self.__credentials[0] if self.__credentials is not None else None,
+            "session_id": self.session_id,
+            "client_token": self.client_token,
+            "client_info": dict(self.client_info.raw),
+            "cookies": [
+                {"name": c.name, "value": c.value, "domain": c.domain, "path": c.path} for c in self.session.cookies
+            ],
+        }
+        with os.fdopen(os.open(session_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as file:
+            json.dump(state, file)
+
+    def restore_session(self, session_file: str, username: Optional[str] = None) -> bool:
+        """Restore a session saved with save_session, returns False when there is no usable saved session.
+
+        With a `username`, a session that was saved for another user is not usable.
+        """
+        try:
+            with open(session_file) as file:
+                state = json.load(file)
+            session_id, client_token, client_info = state["session_id"], state["client_token"], state["client_info"]
+        except (OSError, ValueError, KeyError):
+            return False
+        if username is not None and state.get("username") != username:
+            return False
+
+        self.session_id = session_id
+        self.client_token = client_token
+        self.client_info = ClientInfo(client_info)
+        for cookie in state.get("cookies", []):
+            self.session.cookies.set(cookie["name"], cookie["value"], domain=cookie["domain"], path=cookie["path"])
+        return True
+
     def logout(self) -> None:
+        """Log out, removing the session file of the login as its session is no longer valid.
+
+        A session that already expired counts as logged out, without logging in again.
+        """
         logout_payload = {
             "intAccount": self.client_info.account_id,
             "sessionId": self.session_id,
         }
-        self.__request(
-            DeGiro.__LOGOUT_URL + ";jsessionid=" + self.session_id,
-            None,
-            logout_payload,
-            error_message="Could not log out",
-        )
+        try:
+            self.__request(
+                DeGiro.__LOGOUT_URL + ";jsessionid=" + self.session_id,
+                None,
+                logout_payload,
+                error_message="Could not log out",
+                endpoint="logout",
+            )
+        except DeGiroSessionExpired:
+            pass
+        finally:
+            if self.__session_file:
+                try:
+                    os.remove(self.__session_file)
+                except FileNotFoundError:
+                    pass
+                self.__session_file = None
 
     def __request(
         self,
@@ -111,34 +300,222 @@ class DeGiro:
         post_params: Optional[Union[Mapping, List[Tuple], bytes]] = None,
         request_type: int = __GET_REQUEST,
         error_message: str = "An error occurred.",
+        endpoint: str = "default",
+        decoder: Optional[Decoder] = None,
     ) -> Union[Mapping, List]:
+        """Send a request, sharing the response of an identical request to a coalesced endpoint that is in flight.
+
+        The response is decoded with `decoder`, or with the JSON decoder of the client when it is not given.
+        """
+        if endpoint not in self.coalesced_endpoints:
+            return self.__request_with_retries(
+                url, cookie, payload, headers, data, post_params, request_type, error_message, endpoint, decoder
+            )
+        return self.single_flight.do(
+            flight_key(endpoint, url, payload, data, post_params, decoder),
+            lambda: self.__request_with_retries(
+                url, cookie, payload, headers, data, post_params, request_type, error_message, endpoint, decoder
+            ),
+        )
+
+    def __request_with_retries(
+        self,
+        url: str,
+        cookie: Optional[Mapping],
+        payload: Optional[Union[Mapping, List[Tuple], bytes]],
+        headers: Optional[Mapping],
+        data: Optional[Union[Mapping, List[Tuple], bytes, str]],
+        post_params: Optional[Union[Mapping, List[Tuple], bytes]],
+        request_type: int,
+        error_message: str,
+        endpoint: str,
+        decoder: Optional[Decoder],
+    ) -> Union[Mapping, List]:
+        """Send a request, retrying it according to the RetryPolicy of its endpoint.
+
+        When the session expired, we log in again and replay the request once.
+        """
+        policy = self.retry_policies.get(endpoint, DeGiro.DEFAULT_RETRY_POLICY)
+        attempt = 0
+        sent = 0
+        logged_in_again = False
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(
+                    DeGiro.ENDPOINT_FAMILIES.get(endpoint, endpoint),
+                    DeGiro.ENDPOINT_PRIORITIES.get(endpoint, Priority.NORMAL),
+                )
+            session_id = self.session_id
+            try:
+                if self.hooks:
+                    response = self.__send_observed(
+                        endpoint, sent, url, cookie, payload, headers, data, post_params, request_type
+                    )
+                else:
+                    response = self.__send(url, cookie, payload, headers, data, post_params, request_type)
+            except requests.RequestException as exc:
+                if policy.retry_connection_errors and attempt < policy.max_retries:
+                    time.sleep(policy.backoff(attempt))
+                    attempt += 1
+                    continue
+                raise DeGiroConnectionError(f"{error_message} {exc}") from exc
+            finally:
+                sent += 1
 
+            if response.status_code == 200 or response.status_code == 201:
+                try:
+                    return (decoder or self.json_loads)(response.content)
+                except VALIDATION_ERRORS:
+                    raise
+                except Exception as exc:
+                    raise ValueError("No data was returned.") from exc
+
+            if (
+                response.status_code == 401
+                and not logged_in_again
+                and self.__credentials is not None
+                and endpoint not in DeGiro.__LOGIN_ENDPOINTS
+            ):
+                # The session expired and DeGiro rejected the request, so it is safe to replay it in a new session.
+                self.__login_again(session_id)
+                url, cookie, payload, data, post_params = (
+                    DeGiro.__rebind_session(value, session_id, self.session_id)
+                    for value in (url, cookie, payload, data, post_params)
+                )
+                logged_in_again = True
+                continue
+
+            if response.status_code in policy.retry_on_status and attempt < policy.max_retries:
+                delay = policy.backoff(attempt)
+                retry_after = response.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    delay = max(delay, min(float(retry_after), policy.backoff_max))
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            raise DeGiro.__request_error(response, f"{error_message} Response: {response.text}")
+
+    def __send_observed(
+        self,
+        endpoint: str,
+        attempt: int,
+        url: str,
+        cookie: Optional[Mapping],
+        payload: Optional[Union[Mapping, List[Tuple], bytes]],
+        headers: Optional[Mapping],
+        data: Optional[Union[Mapping, List[Tuple], bytes, str]],
+        post_params: Optional[Union[Mapping, List[Tuple], bytes]],
+        request_type: int,
+    ) -> requests.Response:
+        """Send a request like __send, while passing a RequestEvent to each of the hooks."""
+        event = RequestEvent(
+            endpoint=endpoint,
+            method=DeGiro.__METHODS.get(request_type, "UNKNOWN"),
+            url=url.split(";")[0],
+            attempt=attempt,
+            started=time.time(),
+        )
+        for hook in self.hooks:
+            hook.before_request(event)
+        started = time.perf_counter()
+        try:
+            response = self.__send(url, cookie, payload, headers, data, post_params, request_type)
+        except requests.RequestException as exc:
+            event = event._replace(elapsed=time.perf_counter() - started, error=exc)
+            for hook in self.hooks:
+                hook.on_error(event)
+            raise
+
+        body = getattr(getattr(response, "request", None), "body", None)
+        event = event._replace(
+            elapsed=time.perf_counter() - started,
+            status_code=response.status_code,
+            request_bytes=len(body) if body else 0,
+            response_bytes=len(response.content),
+        )
+        for hook in self.hooks:
+            hook.after_response(event)
+        if response.status_code != 200 and response.status_code != 201:
+            for hook in self.hooks:
+                hook.on_error(event)
+        return response
+
+    def __login_again(self, expired_session_id: Optional[str]) -> None:
+        with self.__login_lock:
+            # Another thread may already have replaced the expired session while we waited for the lock.
+            if self.session_id == expired_session_id:
+                self.__login(*self.__credentials)
+                if self.__session_file:
+                    self.save_session(self.__session_file)
+
+    @staticmethod
+    def __request_error(response: requests.Response, message: str) -> DeGiroRequestError:
+        error_type: Type[DeGiroRequestError]
+        if response.status_code == 401:
+            error_type = DeGiroSessionExpired
+        elif response.status_code == 429:
+            error_type = DeGiroRateLimited
+        elif response.status_code >= 500:
+            error_type = DeGiroServerError
+        else:
+            error_type = DeGiroRequestError
+        return error_type(message, response.status_code, response.text)
+
+    def __send(
+        self,
+        url: str,
+        cookie: Optional[Mapping],
+        payload: Optional[Union[Mapping, List[Tuple], bytes]],
+        headers: Optional[Mapping],
+        data: Optional[Union[Mapping, List[Tuple], bytes, str]],
+        post_params: Optional[Union[Mapping, List[Tuple], bytes]],
+        request_type: int,
+    ) -> requests.Response:
         if request_type == DeGiro.__DELETE_REQUEST:
-            response = self.session.delete(url, json=payload)
+            kwargs: Dict[str, Any] = {"json": payload}
         elif request_type == DeGiro.__GET_REQUEST and cookie:
-            response = self.session.get(url, cookies=cookie)
+            kwargs = {"cookies": cookie}
         elif request_type == DeGiro.__GET_REQUEST:
-            response = self.session.get(url, params=payload)
+            kwargs = {"params": payload}
         elif request_type == DeGiro.__POST_REQUEST and headers and data:
-            response = self.session.post(url, headers=headers, params=payload, data=data)
+            kwargs = {"headers": headers, "params": payload, "data": data}
         elif request_type == DeGiro.__POST_REQUEST and post_params:
-            response = self.session.post(url, params=post_params, json=payload)
+            kwargs = {"params": post_params, "json": payload}
         elif request_type == DeGiro.__POST_REQUEST:
-            response = self.session.post(url, json=payload)
+            kwargs = {"json": payload}
         elif request_type == DeGiro.__PUT_REQUEST:
-            response = self.session.put(url, params=post_params, json=payload)
+            kwargs = {"params": post_params, "json": payload}
         else:
             raise ValueError(f"Unknown request type: {request_type}")
+        return self.transport.send(DeGiro.__METHODS[request_type], url, **kwargs)
 
-        if response.status_code == 200 or response.status_code == 201:
-            try:
-                return response.json()
-            except Exception:
-                raise ValueError("No data was returned.")
-        else:
-            raise Exception(f"{error_message} Response: {response.text}")
+    @staticmethod
+    def __rebind_session(value: Any, expired_session_id: str, session_id: str) -> Any:
+        if isinstance(value, str):
+            return value.replace(expired_session_id, session_id)
+        if isinstance(value, bytes):
+            return value.replace(expired_session_id.encode(), session_id.encode())
+        if isinstance(value, Mapping):
+            return {k: DeGiro.__rebind_session(v, expired_session_id, session_id) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return type(value)(DeGiro.__rebind_session(v, expired_session_id, session_id) for v in value)
+        return value
+
+    def account_overview(
+        self, from_date: datetime.datetime, to_date: datetime.datetime, max_workers: int = 4
+    ) -> Union[List, Mapping]:
+        """Get the account overview, long ranges are fetched concurrently in windows and merged."""
+        windows = DeGiro.__fetch_windows(
+            self.__account_overview, split_date_range(from_date, to_date, DeGiro.REPORTING_WINDOW_DAYS), max_workers
+        )
+        if len(windows) == 1:
+            return windows[0]
+        overview = dict(windows[0])
+        overview["cashMovements"] = list(iter_unique((w.get("cashMovements", []) for w in windows), "id"))
+        return overview
 
-    def account_overview(self, from_date: datetime.datetime, to_date: datetime.datetime) -> Union[List, Mapping]:
+    def __account_overview(self, from_date: datetime.datetime, to_date: datetime.datetime) -> Mapping:
         account_payload = {
             "fromDate": from_date.strftime("%d/%m/%Y"),
             "toDate": to_date.strftime("%d/%m/%Y"),
@@ -146,46 +523,139 @@ class DeGiro:
             "sessionId": self.session_id,
         }
         return self.__request(  # type: ignore
-            DeGiro.__ACCOUNT_URL, None, account_payload, error_message="Could not get account overview."
+            DeGiro.__ACCOUNT_URL,
+            None,
+            account_payload,
+            error_message="Could not get account overview.",
+            endpoint="account_overview",
         )["data"]
 
-    def get_exchange_rate(self, exchange):
-        exchange_ids = {
-            "EUR/USD": "705366",
-            "EUR/GBP": "714324",
-            "EUR/CHF": "714322",
-            "EUR/JPY": "1316472",
-            "GBP/USD": "1788982",
-        }
-        last_rate = self.real_time_price(exchange_ids[exchange], interval=IntervalType.One_Day)[0]["data"]["lastPrice"]
-        return last_rate
+    @staticmethod
+    def __fetch_windows(
+        fetch: Callable[[datetime.datetime, datetime.datetime], Any],
+        windows: List[Tuple[datetime.datetime, datetime.datetime]],
+        max_workers: int,
+    ) -> List[Any]:
+        """Fetch every date window concurrently, returning the results in the order of the windows."""
+        if len(windows) == 1:
+            return [fetch(*windows[0])]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda window: fetch(*window), windows))
+
+    def get_exchange_rate(self, exchange: str) -> float:
+        """Get the rate of a currency pair like "EUR/USD", inverse and cross pairs like "GBP/CHF" are derived."""
+        base, quote = exchange.split("/")
+        return self.exchange_rates.rate(base, quote)
 
     def search_products(self, search_text: str, limit: int = 1) -> List[Mapping]:
+        return self.__search_products(search_text, 0, limit)
+
+    def iter_search_products(self, search_text: str, page_size: int = 100, prefetch: bool = True) -> Iterator[Product]:
+        """Yield all products matching `search_text`, fetching them page by page."""
+        return DeGiro.__iter_pages(functools.partial(self.__search_products, search_text), page_size, prefetch)
+
+    def __search_products(self, search_text: str, offset: int, limit: Optional[int]) -> List[Mapping]:
         product_search_payload = {
             "searchText": search_text,
             "limit": limit,
-            "offset": 0,
+            "offset": offset,
             "intAccount": self.client_info.account_id,
             "sessionId": self.session_id,
         }
         return self.__request(  # type: ignore
-            DeGiro.__PRODUCT_SEARCH_URL, None, product_search_payload, error_message="Could not get products."
-        )["products"]
+            DeGiro.__PRODUCT_SEARCH_URL,
+            None,
+            product_search_payload,
+            error_message="Could not get products.",
+            endpoint="search_products",
+        ).get("products", [])
+
+    @staticmethod
+    def __iter_pages(
+        fetch_page: Callable[[int, int], List[Mapping]], page_size: int, prefetch: bool
+    ) -> Iterator[Product]:
+        """Walk the offset/limit pages of `fetch_page`, with `prefetch` the next page is fetched in the background."""
+        if page_size < 1:
+            raise ValueError("Parameter page_size should be at least 1")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            offset = 0
+            next_page = executor.submit(fetch_page, offset, page_size) if prefetch else None
+            while True:
+                page = next_page.result() if next_page is not None else fetch_page(offset, page_size)
+                offset += page_size
+                last_page = len(page) < page_size
+                if prefetch and not last_page:
+                    next_page = executor.submit(fetch_page, offset, page_size)
+                for product in page:
+                    yield Product(product)
+                if last_page:
+                    return
+
+    def products_info(
+        self, product_ids: Iterable[Union[int, str]], chunk_size: int = PRODUCT_INFO_CHUNK_SIZE
+    ) -> Dict[str, Mapping]:
+        """Get the info of many products, requesting them in chunks of `chunk_size` ids per round-trip."""
+        if chunk_size < 1:
+            raise ValueError("Parameter chunk_size should be at least 1")
+
+        products: Dict[str, Mapping] = {}
+        ids = []
+        for product_id in dict.fromkeys(str(product_id) for product_id in product_ids):
+            cached = self.product_cache.get(product_id)
+            if cached is None:
+                ids.append(product_id)
+            else:
+                products[product_id] = cached
 
-    def product_info(self, product_id: int) -> Mapping:
         product_info_payload = {"intAccount": self.client_info.account_id, "sessionId": self.session_id}
-        return self.__request(  # type: ignore
-            DeGiro.__PRODUCT_INFO_URL,
-            None,
-            product_info_payload,
-            headers={"content-type": "application/json"},
-            data=json.dumps([str(product_id)]),
-            request_type=DeGiro.__POST_REQUEST,
-            error_message="Could not get product info.",
-        )["data"][str(product_id)]
+        for start in range(0, len(ids), chunk_size):
+            fetched = self.__request(  # type: ignore
+                DeGiro.__PRODUCT_INFO_URL,
+                None,
+                product_info_payload,
+                headers={"content-type": "application/json"},
+                data=json.dumps(ids[start : start + chunk_size]),
+                request_type=DeGiro.__POST_REQUEST,
+                error_message="Could not get product info.",
+                endpoint="product_info",
+            )["data"]
+            for product_id, info in fetched.items():
+                self.product_cache.put(product_id, info)
+            products.update(fetched)
+        return products
+
+    def product_info(self, product_id: Union[int, str]) -> Mapping:
+        return self.products_info([product_id])[str(product_id)]
 
     def transactions(
-        self, from_date: datetime.datetime, to_date: datetime.datetime, group_transactions: bool = False
+        self,
+        from_date: datetime.datetime,
+        to_date: datetime.datetime,
+        group_transactions: bool = False,
+        max_workers: int = 4,
+        type_: Any = None,
+    ) -> List[Mapping]:
+        """Get the transactions, long ranges are fetched concurrently in windows and merged.
+
+        With a `type_`, like a msgspec.Struct, each transaction is decoded straight into that type.
+        """
+        windows = split_date_range(from_date, to_date, DeGiro.REPORTING_WINDOW_DAYS)
+        fetch = functools.partial(self.__transactions, group_transactions=group_transactions, type_=type_)
+        return list(iter_unique(DeGiro.__fetch_windows(fetch, windows, max_workers), "id"))
+
+    def iter_transactions(
+        self,
+        from_date: datetime.datetime,
+        to_date: datetime.datetime,
+        group_transactions: bool = False,
+        type_: Any = None,
+    ) -> Iterator[Mapping]:
+        """Yield the transactions window by window, holding only one window in memory."""
+        windows = split_date_range(from_date, to_date, DeGiro.REPORTING_WINDOW_DAYS)
+        return iter_unique((self.__transactions(start, end, group_transactions, type_) for start, end in windows), "id")
+
+    def __transactions(
+        self, from_date: datetime.datetime, to_date: datetime.datetime, group_transactions: bool, type_: Any = None
     ) -> List[Mapping]:
         transactions_payload = {
             "fromDate": from_date.strftime("%d/%m/%Y"),
@@ -195,32 +665,55 @@ class DeGiro:
             "sessionId": self.session_id,
         }
         return self.__request(  # type: ignore
-            DeGiro.__TRANSACTIONS_URL, None, transactions_payload, error_message="Could not get transactions."
+            DeGiro.__TRANSACTIONS_URL,
+            None,
+            transactions_payload,
+            error_message="Could not get transactions.",
+            endpoint="transactions",
+            decoder=envelope_decoder("data", type_) if type_ is not None else None,
         )["data"]
 
     def orders(
-        self, from_date: datetime.datetime, to_date: datetime.datetime, not_executed: bool = False
+        self,
+        from_date: datetime.datetime,
+        to_date: datetime.datetime,
+        not_executed: bool = False,
+        max_workers: int = 4,
+        type_: Any = None,
     ) -> List[Mapping]:
+        """Get the order history, ranges over 90 days are fetched concurrently in windows and merged.
+
+        With a `type_`, like a msgspec.Struct, each order is decoded straight into that type.
+        """
+        windows = split_date_range(from_date, to_date, DeGiro.ORDERS_WINDOW_DAYS)
+        fetch = functools.partial(self.__orders, type_=type_)
+        data = iter_unique(DeGiro.__fetch_windows(fetch, windows, max_workers), "orderId")
+        if not_executed:
+            return [d for d in data if field_of(d, "isActive")]
+        return list(data)
+
+    def iter_orders(
+        self, from_date: datetime.datetime, to_date: datetime.datetime, type_: Any = None
+    ) -> Iterator[Mapping]:
+        """Yield the order history window by window, holding only one window in memory."""
+        windows = split_date_range(from_date, to_date, DeGiro.ORDERS_WINDOW_DAYS)
+        return iter_unique((self.__orders(start, end, type_) for start, end in windows), "orderId")
+
+    def __orders(self, from_date: datetime.datetime, to_date: datetime.datetime, type_: Any = None) -> List[Mapping]:
         orders_payload = {
             "fromDate": from_date.strftime("%d/%m/%Y"),
             "toDate": to_date.strftime("%d/%m/%Y"),
             "intAccount": self.client_info.account_id,
             "sessionId": self.session_id,
         }
-        # max 90 days
-        if (to_date - from_date).days > 90:
-            raise Exception("The maximum timespan is 90 days")
-        data = self.__request(DeGiro.__ORDERS_URL, None, orders_payload, error_message="Could not get orders.")[
-            "data"
-        ]  # type: ignore
-        data_not_executed = []
-        if not_executed:
-            for d in data:
-                if d["isActive"]:
-                    data_not_executed.append(d)
-            return data_not_executed
-        else:
-            return data
+        return self.__request(  # type: ignore
+            DeGiro.__ORDERS_URL,
+            None,
+            orders_payload,
+            error_message="Could not get orders.",
+            endpoint="orders",
+            decoder=envelope_decoder("data", type_) if type_ is not None else None,
+        )["data"]
 
     def delete_order(self, order_id: str) -> Union[Mapping, List, str]:
         delete_order_params = {
@@ -234,8 +727,17 @@ class DeGiro:
             delete_order_params,
             request_type=DeGiro.__DELETE_REQUEST,
             error_message="Could not delete order" + " " + order_id,
+            endpoint="delete_order",
         )
 
+    def delete_orders(self, order_ids: Iterable[str], max_workers: int = 10) -> List[CancelResult]:
+        """Delete many orders in parallel, returning a CancelResult per order in the order of `order_ids`."""
+        order_ids = list(order_ids)
+        self.__ensure_pool_size(max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outcomes = list(executor.map(lambda order_id: DeGiro.__timed(self.delete_order, order_id), order_ids))
+        return [CancelResult(order_id, error, seconds) for order_id, (_, error, seconds) in zip(order_ids, outcomes)]
+
     @staticmethod
     def filter_cash_funds(cash_funds: Mapping) -> List[Mapping]:
         data = []
@@ -246,79 +748,155 @@ class DeGiro:
 
     @staticmethod
     def filter_portfolio(portfolio: Mapping, filter_zero: bool = False) -> List[Mapping]:
-        data: List[Mapping] = []
-        for item in portfolio["portfolio"]["value"]:
-            position_type = size = price = value = break_even_price = None
-            for i in item["value"]:
-                size = i["value"] if i["name"] == "size" else size
-                position_type = i["value"] if i["name"] == "positionType" else position_type
-                price = i["value"] if i["name"] == "price" else price
-                value = i["value"] if i["name"] == "value" else value
-                break_even_price = i["value"] if i["name"] == "breakEvenPrice" else break_even_price
-            data.append(
-                {
-                    "id": item["id"],
-                    "positionType": position_type,
-                    "size": size,
-                    "price": price,
-                    "value": value,
-                    "breakEvenPrice": break_even_price,
-                }
-            )
-        if filter_zero:
-            data_non_zero: List[Mapping] = []
-            for d in data:
-                if d["size"] != 0.0:
-                    data_non_zero.append(d)
-            return data_non_zero
-        else:
-            return data
+        return parse_position_dicts(portfolio, filter_zero)
+
+    def get_positions(self, filter_zero: bool = False) -> List[Position]:
+        return parse_positions(self.get_update({DataType.PORTFOLIO: 0}), filter_zero)
 
     def get_data(self, datatype: str, filter_zero: bool = False) -> List[Mapping]:
-        data_payload = {datatype: 0}
+        data = self.get_update({datatype: 0})
 
         if datatype == DataType.CASH_FUNDS:
-            return self.filter_cash_funds(
-                self.__request(  # type: ignore
-                    DeGiro.__DATA_URL + str(self.client_info.account_id) + ";jsessionid=" + self.session_id,
-                    None,
-                    data_payload,
-                    error_message="Could not get data",
-                )
-            )
+            return self.filter_cash_funds(data)
         elif datatype == DataType.PORTFOLIO:
-            return self.filter_portfolio(
-                self.__request(  # type: ignore
-                    DeGiro.__DATA_URL + str(self.client_info.account_id) + ";jsessionid=" + self.session_id,
-                    None,
-                    data_payload,
-                    error_message="Could not get data",
-                ),
-                filter_zero,
-            )
+            return self.filter_portfolio(data, filter_zero)
         else:
-            return self.__request(
-                DeGiro.__DATA_URL + str(self.client_info.account_id) + ";jsessionid=" + self.session_id,
-                None,
-                data_payload,
-                error_message="Could not get data",
-            )  # type: ignore
+            return data  # type: ignore
+
+    def get_data_many(self, datatypes: Iterable[str], filter_zero: bool = False) -> Dict[str, Any]:
+        """Get several datatypes with a single request, keyed by datatype.
+
+        The portfolio and cash funds are parsed like in get_data, other datatypes are returned as their raw section.
+        """
+        datatypes = list(dict.fromkeys(datatypes))
+        data = self.get_update(dict.fromkeys(datatypes, 0))
+
+        sections: Dict[str, Any] = {}
+        for datatype in datatypes:
+            if datatype == DataType.CASH_FUNDS:
+                sections[datatype] = self.filter_cash_funds(data)
+            elif datatype == DataType.PORTFOLIO:
+                sections[datatype] = self.filter_portfolio(data, filter_zero)
+            else:
+                sections[datatype] = data.get(datatype)
+        return sections
+
+    def get_update(self, last_updated: Mapping[str, int]) -> Mapping:
+        """Get the raw update of each datatype, with the changes since its `lastUpdated` counter or all data for 0."""
+        return self.__request(  # type: ignore
+            DeGiro.__DATA_URL + str(self.client_info.account_id) + ";jsessionid=" + self.session_id,
+            None,
+            dict(last_updated),
+            error_message="Could not get data",
+            endpoint="update",
+        )
+
+    def vwd_identifier(self, product_id: Union[int, str]) -> Tuple[str, str]:
+        """Get the (vwdIdentifierType, vwdId) of a product, which is needed to request its price data."""
+        identifier = self.product_cache.get_vwd_identifier(product_id)
+        if identifier is None:
+            product_info = self.product_info(product_id)
+            identifier = (product_info["vwdIdentifierType"], product_info["vwdId"])
+        return identifier
+
+    def vwd_identifiers(self, product_ids: Iterable[Union[int, str]]) -> Dict[str, Tuple[str, str]]:
+        """Get the vwd identifiers of many products, products without price data are left out."""
+        identifiers: Dict[str, Tuple[str, str]] = {}
+        missing = []
+        for product_id in dict.fromkeys(str(product_id) for product_id in product_ids):
+            identifier = self.product_cache.get_vwd_identifier(product_id)
+            if identifier is None:
+                missing.append(product_id)
+            else:
+                identifiers[product_id] = identifier
+        if missing:
+            for product_id, product_info in self.products_info(missing).items():
+                if "vwdId" in product_info and "vwdIdentifierType" in product_info:
+                    identifiers[product_id] = (product_info["vwdIdentifierType"], product_info["vwdId"])
+        return identifiers
+
+    def real_time_price(self, product_id: int, interval: str, type_: Any = None):
+        """Get the price data of a product, with a `type_` each series is decoded straight into that type."""
+        return self.__real_time_price(self.vwd_identifier(product_id), interval, type_)
+
+    def real_time_prices(
+        self, product_ids: Iterable[Union[int, str]], interval: str, max_workers: int = 10
+    ) -> Iterator[PriceResult]:
+        """Fetch the price data of many products in parallel, yielding a PriceResult for each as it completes.
 
-    def real_time_price(self, product_id: int, interval: str):
-        product_info = self.product_info(product_id)
+        A product for which the price data could not be fetched yields a PriceResult holding the error instead.
+        """
+        unique_ids: List[str] = list(dict.fromkeys(str(product_id) for product_id in product_ids))
+        try:
+            identifiers = self.vwd_identifiers(unique_ids)
+        except Exception as exc:
+            for product_id in unique_ids:
+                yield PriceResult(product_id, None, exc)
+            return
+
+        self.__ensure_pool_size(max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for product_id in unique_ids:
+                if product_id in identifiers:
+                    future = executor.submit(self.__real_time_price, identifiers[product_id], interval)
+                    futures[future] = product_id
+                else:
+                    yield PriceResult(product_id, None, KeyError(f"Product {product_id} has no price data."))
+            for future in as_completed(futures):
+                try:
+                    yield PriceResult(futures[future], future.result())
+                except Exception as exc:
+                    yield PriceResult(futures[future], None, exc)
 
-        vw_id = product_info["vwdId"]
-        vw_id_type = product_info["vwdIdentifierType"]
+    def combined_real_time_prices(
+        self, product_ids: Iterable[Union[int, str]], interval: str, batch_size: int = PRICE_DATA_BATCH_SIZE
+    ) -> Dict[str, List[Mapping]]:
+        """Fetch the price data of many products, packing up to `batch_size` products in one chart request.
 
+        Returns the series of each product keyed by product id, products without price data are left out.
+        """
+        if batch_size < 1:
+            raise ValueError("Parameter batch_size should be at least 1")
+
+        identifiers = list(self.vwd_identifiers(product_ids).items())
+        prices: Dict[str, List[Mapping]] = {}
+        for start in range(0, len(identifiers), batch_size):
+            series_products: Dict[str, str] = {}
+            for product_id, vwd_identifier in identifiers[start : start + batch_size]:
+                for series_id in self.__price_series(vwd_identifier):
+                    series_products[series_id] = product_id
+                prices[product_id] = []
+            requested = list(series_products)
+            for position, series in enumerate(self.__price_data(requested, interval)):
+                series_id = series.get("id", requested[position] if position < len(requested) else None)
+                if series_id in series_products:
+                    prices[series_products[series_id]].append(series)
+        return prices
+
+    @staticmethod
+    def __price_series(vwd_identifier: Tuple[str, str]) -> List[str]:
+        vw_id_type, vw_id = vwd_identifier
+        return [vw_id_type + ":" + vw_id, "price:" + vw_id_type + ":" + vw_id]
+
+    def __real_time_price(self, vwd_identifier: Tuple[str, str], interval: str, type_: Any = None) -> List[Mapping]:
+        return self.__price_data(self.__price_series(vwd_identifier), interval, type_)
+
+    def __price_data(self, series: List[str], interval: str, type_: Any = None) -> List[Mapping]:
         price_payload = {
             "requestid": 1,
             "period": interval,
-            "series": [vw_id_type + ":" + vw_id, "price:" + vw_id_type + ":" + vw_id],
+            "series": series,
             "userToken": self.client_token,
         }
 
         return self.__request(  # type: ignore
-            DeGiro.__PRICE_DATA_URL, None, price_payload, error_message="Could not get real time price"
+            DeGiro.__PRICE_DATA_URL,
+            None,
+            price_payload,
+            error_message="Could not get real time price",
+            endpoint="price_data",
+            decoder=envelope_decoder("series", type_) if type_ is not None else None,
         )["series"]
 
     def buy_order(
@@ -369,56 +947,115 @@ class DeGiro:
         limit: Optional[Union[int, float]],
         stop_loss: Optional[Union[int, float]],
     ) -> str:
-        if buy_sell not in (
-            "SELL",
-            "BUY",
-        ):
-            raise ValueError("Parameter buy_sell should either be 'SELL' or 'BUY'")
+        order = OrderSpec(buy_sell, order_type, product_id, time_type, size, limit, stop_loss)
+        confirmation_id = self.__check_order(order)
+        self.__confirm_order(order, confirmation_id)
+        return confirmation_id
 
-        place_order_params = {
-            "intAccount": self.client_info.account_id,
-            "sessionId": self.session_id,
-        }
-        place_order_payload = {
-            "buySell": buy_sell,
-            "orderType": order_type,
-            "productId": product_id,
-            "timeType": time_type,
-            "size": size,
-            "price": limit,
-            "stopPrice": stop_loss,
-        }
-        if (
-            order_type != OrderType.STOP_LIMIT
-            and order_type != OrderType.MARKET
-            and order_type != OrderType.LIMIT
-            and order_type != OrderType.STOP_LOSS
-        ):
-            raise Exception("Invalid order type")
+    def place_orders(self, orders: Iterable[OrderSpec], max_workers: int = 10) -> List[OrderResult]:
+        """Place many orders, first checking all of them in parallel and then confirming the ones that passed.
 
-        if time_type != 1 and time_type != 3:
-            raise Exception("Invalid time type")
+        Returns an OrderResult with the timings per order, in the order of `orders`. An order that fails is reported in
+        its result and does not stop the others.
+        """
+        orders = list(orders)
+        self.__ensure_pool_size(max_workers)
+
+        def confirm(order: OrderSpec, check: Tuple[Any, Optional[Exception], float]) -> Tuple[Any, Any, Any]:
+            confirmation_id, error, _ = check
+            if error is not None:
+                return None, None, None
+            return DeGiro.__timed(self.__confirm_order, order, confirmation_id)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            checks = list(executor.map(lambda order: DeGiro.__timed(self.__check_order, order), orders))
+            confirms = list(executor.map(confirm, orders, checks))
+
+        results = []
+        for order, (confirmation_id, check_error, check_seconds), (order_id, confirm_error, confirm_seconds) in zip(
+            orders, checks, confirms
+        ):
+            if check_error is not None:
+                results.append(OrderResult(order, None, None, check_error, "check", check_seconds, None))
+            elif confirm_error is not None:
+                results.append(
+                    OrderResult(order, confirmation_id, None, confirm_error, "confirm", check_seconds, confirm_seconds)
+                )
+            else:
+                results.append(
+                    OrderResult(order, confirmation_id, order_id, None, None, check_seconds, confirm_seconds)
+                )
+        return results
 
+    def __check_order(self, order: OrderSpec) -> str:
         place_check_order_response = self.__request(
             DeGiro.__PLACE_ORDER_URL + ";jsessionid=" + self.session_id,
             None,
-            place_order_payload,
-            place_order_params,
+            self.__order_payload(order),
+            self.__order_params(),
             request_type=DeGiro.__POST_REQUEST,
             error_message="Could not place order",
+            endpoint="check_order",
         )
+        return place_check_order_response["data"]["confirmationId"]  # type: ignore
 
-        confirmation_id = place_check_order_response["data"]["confirmationId"]  # type: ignore
-
-        self.__request(
+    def __confirm_order(self, order: OrderSpec, confirmation_id: str) -> Optional[str]:
+        """Confirm a checked order, returning the id of the placed order when DeGiro tells it."""
+        confirm_order_response = self.__request(
             DeGiro.__ORDER_URL + confirmation_id + ";jsessionid=" + self.session_id,
             None,
-            place_order_payload,
-            place_order_params,
+            self.__order_payload(order),
+            self.__order_params(),
             request_type=DeGiro.__POST_REQUEST,
             error_message="Could not confirm order",
+            endpoint="confirm_order",
         )
-        return confirmation_id
+        data = confirm_order_response.get("data") if isinstance(confirm_order_response, Mapping) else None
+        return data.get("orderId") if isinstance(data, Mapping) else None
+
+    def __order_params(self) -> Mapping:
+        return {
+            "intAccount": self.client_info.account_id,
+            "sessionId": self.session_id,
+        }
+
+    @staticmethod
+    def __order_payload(order: OrderSpec) -> Mapping:
+        if order.buy_sell not in (
+            "SELL",
+            "BUY",
+        ):
+            raise ValueError("Parameter buy_sell should either be 'SELL' or 'BUY'")
+
+        if (
+            order.order_type != OrderType.STOP_LIMIT
+            and order.order_type != OrderType.MARKET
+            and order.order_type != OrderType.LIMIT
+            and order.order_type != OrderType.STOP_LOSS
+        ):
+            raise Exception("Invalid order type")
+
+        if order.time_type != 1 and order.time_type != 3:
+            raise Exception("Invalid time type")
+
+        return {
+            "buySell": order.buy_sell,
+            "orderType": order.order_type,
+            "productId": order.product_id,
+            "timeType": order.time_type,
+            "size": order.size,
+            "price": order.limit,
+            "stopPrice": order.stop_loss,
+        }
+
+    @staticmethod
+    def __timed(func: Callable, *args: Any) -> Tuple[Any, Optional[Exception], float]:
+        """Call `func`, returning its result or the exception it raised, and the seconds it took."""
+        started = time.perf_counter()
+        try:
+            return func(*args), None, time.perf_counter() - started
+        except Exception as exc:
+            return None, exc, time.perf_counter() - started
 
     def modify_order(
         self,
@@ -459,6 +1096,7 @@ class DeGiro:
             modify_order_params,
             request_type=DeGiro.__PUT_REQUEST,
             error_message="Could not modify order" + " " + order_id,
+            endpoint="modify_order",
         )
 
     def future_dividends(self) -> List[Mapping]:
@@ -468,22 +1106,39 @@ class DeGiro:
             None,
             dividends_payload,
             error_message="Could not get future dividends.",
+            endpoint="future_dividends",
         )["data"]
 
-    def get_stock_list(self, index_id: int, stock_country_id: int) -> List[Mapping]:
+    def get_stock_list(self, index_id: int, stock_country_id: int, type_: Any = None) -> List[Mapping]:
+        """Get the products of a stock list, with a `type_` each product is decoded straight into that type."""
+        return self.__stock_list(index_id, stock_country_id, 0, None, type_)
+
+    def iter_stock_list(
+        self, index_id: int, stock_country_id: int, page_size: int = 100, prefetch: bool = True
+    ) -> Iterator[Product]:
+        """Yield the products of a stock list, fetching them page by page."""
+        fetch_page = functools.partial(self.__stock_list, index_id, stock_country_id)
+        return DeGiro.__iter_pages(fetch_page, page_size, prefetch)
+
+    def __stock_list(
+        self, index_id: int, stock_country_id: int, offset: int, limit: Optional[int], type_: Any = None
+    ) -> List[Mapping]:
         stock_list_params = {
             "indexId": index_id,
             "stockCountryId": stock_country_id,
-            "offset": 0,
-            "limit": None,
+            "offset": offset,
+            "limit": limit,
             "requireTotal": "true",
             "sortColumns": "name",
             "sortTypes": "asc",
             "intAccount": self.client_info.account_id,
             "sessionId": self.session_id,
         }
-        return self.__request(
-            DeGiro.__GET_STOCKS_URL, None, stock_list_params, error_message="Could not get stock list"
-        )[
-            "products"
-        ]  # type: ignore
+        return self.__request(  # type: ignore
+            DeGiro.__GET_STOCKS_URL,
+            None,
+            stock_list_params,
+            error_message="Could not get stock list",
+            endpoint="stock_list",
+            decoder=envelope_decoder("products", type_) if type_ is not None else None,
+        )["products"]
@@ -1,4 +1,40 @@
+from typing import Optional
+
+
 class DeGiroRequiresTOTP(Exception):
     """This exception is thrown when two factor authentication is enabled but that is not passed onto the login step."""
 
     pass
+
+
+class DeGiroRequestError(Exception):
+    """This exception is thrown when a request to DeGiro fails."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None, response_text: Optional[str] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.response_text = response_text
+
+
+class DeGiroSessionExpired(DeGiroRequestError):
+    """This exception is thrown when the session is no longer valid and it could not be renewed."""
+
+    pass
+
+
+class DeGiroRateLimited(DeGiroRequestError):
+    """This exception is thrown when DeGiro keeps throttling our requests."""
+
+    pass
+
+
+class DeGiroServerError(DeGiroRequestError):
+    """This exception is thrown when DeGiro keeps failing with a server error."""
+
+    pass
+
+
+class DeGiroConnectionError(DeGiroRequestError):
+    """This exception is thrown when DeGiro could not be reached."""
+
+    pass
@@ -0,0 +1,138 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, TYPE_CHECKING, Union
+
+from degiroapi.interval_type import IntervalType
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+if TYPE_CHECKING:  # pragma: no cover
+    from degiroapi.degiro import DeGiro
+
+# The product of each currency pair, its last price is the amount of quote currency for one unit of base currency.
+DEFAULT_PAIRS = {
+    "EUR/USD": "705366",
+    "EUR/GBP": "714324",
+    "EUR/CHF": "714322",
+    "EUR/JPY": "1316472",
+    "GBP/USD": "1788982",
+}
+
+
+class ExchangeRates:
+    """Exchange rates between all currencies that can be reached through the configured pairs.
+
+    The prices of all pairs are fetched together, and the inverse and cross rates (like GBP/CHF through EUR) are
+    derived from them. The rates are fetched again once they are older than `ttl` seconds.
+    """
+
+    def __init__(
+        self,
+        degiro: "DeGiro",
+        pairs: Optional[Mapping[str, Union[int, str]]] = None,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.__degiro = degiro
+        self.pairs = dict(DEFAULT_PAIRS if pairs is None else pairs)
+        self.ttl = ttl
+        self.__clock = clock
+        self.__lock = threading.Lock()
+        self.__rates: Dict[Tuple[str, str], float] = {}
+        self.__updated: Optional[float] = None
+
+    def refresh(self) -> Dict[Tuple[str, str], float]:
+        """Fetch the prices of all pairs at once, and derive the rates between every two reachable currencies."""
+        with self.__lock:
+            return self.__refresh()
+
+    def rates(self) -> Dict[Tuple[str, str], float]:
+        """Get the rate of every (base, quote) currency pair, fetching them when they are not fresh."""
+        with self.__lock:
+            return dict(self.__fresh_rates())
+
+    def rate(self, base: str, quote: str) -> float:
+        """Get the amount of `quote` currency for one unit of `base` currency."""
+        if base == quote:
+            return 1.0
+        with self.__lock:
+            rates = self.__fresh_rates()
+        try:
+            return rates[(base, quote)]
+        except KeyError:
+            raise KeyError(f"No exchange rate for {base}/{quote}.") from None
+
+    def convert(self, amounts: Any, from_currency: Union[str, Sequence[str]], to_currency: str) -> Any:
+        """Convert an amount, or a whole array of amounts, to `to_currency`.
+
+        `from_currency` is either one currency for all amounts or a currency per amount. A single amount gives a
+        float, more amounts give a numpy array when numpy is installed and a list otherwise.
+        """
+        if isinstance(from_currency, str):
+            factor = self.rate(from_currency, to_currency)
+            if isinstance(amounts, (int, float)):
+                return amounts * factor
+            if numpy is not None:
+                return numpy.asarray(amounts, dtype=numpy.float64) * factor
+            return [amount * factor for amount in amounts]
+
+        if numpy is None:
+            factor_by_currency = {currency: self.rate(currency, to_currency) for currency in set(from_currency)}
+            return [amount * factor_by_currency[currency] for amount, currency in zip(amounts, from_currency)]
+        currencies, positions = numpy.unique(numpy.asarray(from_currency, dtype=str), return_inverse=True)
+        factors = numpy.array([self.rate(currency, to_currency) for currency in currencies], dtype=numpy.float64)
+        return numpy.asarray(amounts, dtype=numpy.float64) * factors[positions]
+
+    def __fresh_rates(self) -> Dict[Tuple[str, str], float]:
+        if self.__updated is None or self.__clock() - self.__updated > self.ttl:
+            self.__refresh()
+        return self.__rates
+
+    def __refresh(self) -> Dict[Tuple[str, str], float]:
+        prices = self.__degiro.combined_real_time_prices(self.pairs.values(), IntervalType.One_Day)
+        base_rates: Dict[Tuple[str, str], float] = {}
+        for pair, product_id in self.pairs.items():
+            last_price = _last_price(prices.get(str(product_id), []))
+            if last_price:
+                base, quote = pair.split("/")
+                base_rates[(base, quote)] = last_price
+        self.__rates = _cross_rates(base_rates)
+        self.__updated = self.__clock()
+        return dict(self.__rates)
+
+
+def _last_price(series: Iterable[Mapping]) -> Optional[float]:
+    """Get the last price from the quote object among the series of a product."""
+    for item in series:
+        data = item.get("data")
+        if isinstance(data, Mapping) and data.get("lastPrice") is not None:
+            return float(data["lastPrice"])
+    return None
+
+
+def _cross_rates(base_rates: Mapping[Tuple[str, str], float]) -> Dict[Tuple[str, str], float]:
+    """Derive the rate between every two currencies that are connected through a chain of pairs."""
+    neighbours: Dict[str, List[Tuple[str, float]]] = {}
+    for (base, quote), rate in base_rates.items():
+        neighbours.setdefault(base, []).append((quote, rate))
+        neighbours.setdefault(quote, []).append((base, 1 / rate))
+
+    rates: Dict[Tuple[str, str], float] = {}
+    for source in neighbours:
+        # A breadth first search prefers the shortest chain, so direct pairs are used whenever they exist.
+        reached = {source: 1.0}
+        queue = deque([source])
+        while queue:
+            currency = queue.popleft()
+            for neighbour, rate in neighbours[currency]:
+                if neighbour not in reached:
+                    reached[neighbour] = reached[currency] * rate
+                    queue.append(neighbour)
+        for target, rate in reached.items():
+            if target != source:
+                rates[(source, target)] = rate
+    return rates
@@ -0,0 +1,139 @@
+import datetime
+import json
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Mapping, Optional, Union
+
+from degiroapi.degiro import DeGiro
+
+_TABLES = ("transactions", "cash_movements")
+# The prefix of the keys of records without an id, which are keyed on their day and position within that day.
+_DAY_KEY = "day:"
+
+
+class HistoryStore:
+    """A local SQLite store of the transactions and cash movements, which only fetches what it does not have yet.
+
+    The history of an account does not change, so after a sync the queries are answered without any request.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.__connection = sqlite3.connect(path, check_same_thread=False)
+        self.__lock = threading.Lock()
+        with self.__lock, self.__connection:
+            for table in _TABLES:
+                self.__connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} "
+                    "(id TEXT PRIMARY KEY, day TEXT, product_id TEXT, type TEXT, record TEXT NOT NULL)"
+                )
+                self.__connection.execute(f"CREATE INDEX IF NOT EXISTS {table}_day ON {table} (day)")
+                self.__connection.execute(f"CREATE INDEX IF NOT EXISTS {table}_product ON {table} (product_id)")
+
+    def close(self) -> None:
+        self.__connection.close()
+
+    def sync(
+        self,
+        degiro: DeGiro,
+        from_date: datetime.datetime,
+        to_date: Optional[datetime.datetime] = None,
+    ) -> Dict[str, int]:
+        """Fetch the records from the last stored day on, or from `from_date` when nothing is stored yet.
+
+        Returns the number of fetched records per table. The last stored day is fetched again, as more records could
+        have been added to it after the previous sync. Records without an id, like most cash movements, are keyed on
+        their day and position within the day, and the ones of the fetched days are replaced as a whole.
+        """
+        to_date = to_date or datetime.datetime.now()
+        transactions_from = self.__last_day("transactions") or from_date
+        transactions = degiro.transactions(transactions_from, to_date)
+        self.__store("transactions", transactions, "buysell", transactions_from, to_date)
+
+        cash_movements_from = self.__last_day("cash_movements") or from_date
+        cash_movements = degiro.account_overview(cash_movements_from, to_date).get("cashMovements", [])  # type: ignore
+        self.__store("cash_movements", cash_movements, "type", cash_movements_from, to_date)
+        return {"transactions": len(transactions), "cash_movements": len(cash_movements)}
+
+    def transactions(
+        self,
+        from_date: Optional[datetime.date] = None,
+        to_date: Optional[datetime.date] = None,
+        product_id: Optional[Union[int, str]] = None,
+        buy_sell: Optional[str] = None,
+    ) -> List[Mapping]:
+        return self.__query("transactions", from_date, to_date, product_id, buy_sell)
+
+    def cash_movements(
+        self,
+        from_date: Optional[datetime.date] = None,
+        to_date: Optional[datetime.date] = None,
+        product_id: Optional[Union[int, str]] = None,
+        movement_type: Optional[str] = None,
+    ) -> List[Mapping]:
+        return self.__query("cash_movements", from_date, to_date, product_id, movement_type)
+
+    def __last_day(self, table: str) -> Optional[datetime.datetime]:
+        with self.__lock:
+            (day,) = self.__connection.execute(f"SELECT MAX(day) FROM {table}").fetchone()
+        return datetime.datetime.strptime(day, "%Y-%m-%d") if day else None
+
+    def __store(
+        self,
+        table: str,
+        records: Iterable[Mapping],
+        type_field: str,
+        fetched_from: datetime.datetime,
+        fetched_to: datetime.datetime,
+    ) -> None:
+        rows = []
+        positions: Dict[str, int] = {}
+        for record in records:
+            day = str(record.get("date", ""))[:10]
+            record_id = record.get("id")
+            if record_id is None:
+                # Identical records, like two equal deposits on one day, are distinct movements and each get a row.
+                position = positions[day] = positions.get(day, -1) + 1
+                record_id = f"{_DAY_KEY}{day}:{position}"
+            product_id = record.get("productId")
+            rows.append(
+                (
+                    str(record_id),
+                    day,
+                    None if product_id is None else str(product_id),
+                    record.get(type_field),
+                    json.dumps(record, sort_keys=True),
+                )
+            )
+        with self.__lock, self.__connection:
+            # The fetched days are complete, so their records without an id replace the stored ones of those days.
+            self.__connection.execute(
+                f"DELETE FROM {table} WHERE id LIKE ? AND day BETWEEN ? AND ?",
+                (_DAY_KEY + "%", fetched_from.strftime("%Y-%m-%d"), fetched_to.strftime("%Y-%m-%d")),
+            )
+            self.__connection.executemany(f"INSERT OR REPLACE INTO {table} VALUES (?, ?, ?, ?, ?)", rows)
+
+    def __query(
+        self,
+        table: str,
+        from_date: Optional[datetime.date],
+        to_date: Optional[datetime.date],
+        product_id: Optional[Union[int, str]],
+        record_type: Optional[str],
+    ) -> List[Mapping]:
+        conditions, parameters = [], []
+        if from_date is not None:
+            conditions.append("day >= ?")
+            parameters.append(from_date.strftime("%Y-%m-%d"))
+        if to_date is not None:
+            conditions.append("day <= ?")
+            parameters.append(to_date.strftime("%Y-%m-%d"))
+        if product_id is not None:
+            conditions.append("product_id = ?")
+            parameters.append(str(product_id))
+        if record_type is not None:
+            conditions.append("type = ?")
+            parameters.append(record_type)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self.__lock:
+            rows = self.__connection.execute(f"SELECT record FROM {table}{where} ORDER BY day, rowid", parameters)
+            return [json.loads(record) for (record,) in rows]
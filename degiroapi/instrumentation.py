@@ -0,0 +1,165 @@
+import bisect
+import threading
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, List, NamedTuple, Optional, Sequence
+
+
+class RequestEvent(NamedTuple):
+    """One attempt of a request to DeGiro, as passed to the callbacks of a RequestHook.
+
+    The url is stripped of its `;jsessionid=` part, so that events can be logged without leaking the session.
+    """
+
+    endpoint: str
+    method: str
+    url: str
+    attempt: int
+    started: float
+    request_bytes: int = 0
+    elapsed: Optional[float] = None
+    status_code: Optional[int] = None
+    response_bytes: Optional[int] = None
+    error: Optional[BaseException] = None
+
+
+class RequestHook:
+    """Base class of the hooks that observe the requests of a DeGiro client, override the callbacks you need.
+
+    before_request is called before every attempt and after_response for every response received. on_error is called
+    for every attempt that failed, either with an error status code or without a response.
+    """
+
+    def before_request(self, event: RequestEvent) -> None:
+        pass
+
+    def after_response(self, event: RequestEvent) -> None:
+        pass
+
+    def on_error(self, event: RequestEvent) -> None:
+        pass
+
+
+class _EndpointMetrics:
+    def __init__(self, buckets: Sequence[float], samples: int):
+        self.requests = 0
+        self.retries = 0
+        self.errors = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.latency_sum = 0.0
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.latencies: Deque[float] = deque(maxlen=samples)
+
+
+class MetricsCollector(RequestHook):
+    """Collects latency histograms and percentiles, byte counts, retries and errors per endpoint."""
+
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, buckets: Sequence[float] = BUCKETS, samples: int = 1000):
+        self.buckets = tuple(sorted(buckets))
+        self.__samples = samples
+        self.__lock = threading.Lock()
+        self.__metrics: Dict[str, _EndpointMetrics] = defaultdict(lambda: _EndpointMetrics(self.buckets, samples))
+
+    def before_request(self, event: RequestEvent) -> None:
+        with self.__lock:
+            metrics = self.__metrics[event.endpoint]
+            metrics.requests += 1
+            metrics.retries += event.attempt > 0
+
+    def after_response(self, event: RequestEvent) -> None:
+        with self.__lock:
+            metrics = self.__metrics[event.endpoint]
+            metrics.request_bytes += event.request_bytes
+            metrics.response_bytes += event.response_bytes or 0
+            metrics.latency_sum += event.elapsed or 0.0
+            metrics.bucket_counts[bisect.bisect_left(self.buckets, event.elapsed or 0.0)] += 1
+            metrics.latencies.append(event.elapsed or 0.0)
+
+    def on_error(self, event: RequestEvent) -> None:
+        with self.__lock:
+            self.__metrics[event.endpoint].errors += 1
+
+    def endpoints(self) -> List[str]:
+        return sorted(self.__metrics)
+
+    def percentile(self, endpoint: str, percentile: float) -> Optional[float]:
+        """Get a latency percentile, between 0 and 100, over the most recent responses of an endpoint."""
+        with self.__lock:
+            metrics = self.__metrics.get(endpoint)
+            latencies = sorted(metrics.latencies) if metrics else []
+        if not latencies:
+            return None
+        return latencies[min(len(latencies) - 1, int(round(percentile / 100 * (len(latencies) - 1))))]
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        summary: Dict[str, Dict[str, Any]] = {}
+        for endpoint in self.endpoints():
+            with self.__lock:
+                metrics = self.__metrics[endpoint]
+                summary[endpoint] = {
+                    "requests": metrics.requests,
+                    "retries": metrics.retries,
+                    "errors": metrics.errors,
+                    "request_bytes": metrics.request_bytes,
+                    "response_bytes": metrics.response_bytes,
+                }
+            summary[endpoint].update({f"p{p}": self.percentile(endpoint, p) for p in (50, 90, 99)})
+        return summary
+
+    def to_prometheus(self, prefix: str = "degiro") -> str:
+        """Export the metrics in the Prometheus text exposition format."""
+        lines = []
+        counters = ("requests", "retries", "errors", "request_bytes", "response_bytes")
+        for name in counters:
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            with self.__lock:
+                for endpoint, metrics in sorted(self.__metrics.items()):
+                    lines.append(f'{prefix}_{name}_total{{endpoint="{endpoint}"}} {getattr(metrics, name)}')
+        lines.append(f"# TYPE {prefix}_request_duration_seconds histogram")
+        with self.__lock:
+            for endpoint, metrics in sorted(self.__metrics.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float("inf"),), metrics.bucket_counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(
+                        f'{prefix}_request_duration_seconds_bucket{{endpoint="{endpoint}",le="{le}"}} {cumulative}'
+                    )
+                lines.append(f'{prefix}_request_duration_seconds_sum{{endpoint="{endpoint}"}} {metrics.latency_sum}')
+                lines.append(f'{prefix}_request_duration_seconds_count{{endpoint="{endpoint}"}} {cumulative}')
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetryHook(RequestHook):
+    """Records every attempt of a request as an OpenTelemetry span."""
+
+    def __init__(self, tracer: Any = None):
+        if tracer is None:
+            from opentelemetry import trace
+
+            tracer = trace.get_tracer("degiroapi")
+        self.__tracer = tracer
+
+    def after_response(self, event: RequestEvent) -> None:
+        self.__record(event)
+
+    def on_error(self, event: RequestEvent) -> None:
+        if event.status_code is None:
+            self.__record(event)
+
+    def __record(self, event: RequestEvent) -> None:
+        start_time = int(event.started * 1e9)
+        span = self.__tracer.start_span(f"degiro {event.endpoint}", start_time=start_time)
+        span.set_attribute("http.method", event.method)
+        span.set_attribute("http.url", event.url)
+        span.set_attribute("degiro.endpoint", event.endpoint)
+        span.set_attribute("degiro.attempt", event.attempt)
+        span.set_attribute("http.request_content_length", event.request_bytes)
+        if event.status_code is not None:
+            span.set_attribute("http.status_code", event.status_code)
+            span.set_attribute("http.response_content_length", event.response_bytes or 0)
+        if event.error is not None:
+            span.record_exception(event.error)
+        span.end(end_time=start_time + int((event.elapsed or 0.0) * 1e9))
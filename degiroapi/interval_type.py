@@ -1,12 +1,12 @@
 class IntervalType:
     """The interval for which we would like the historical data."""
 
-    One_Day = ("P1D",)
-    One_Week = ("P1W",)
-    One_Month = ("P1M",)
-    Three_Months = ("P3M",)
-    Six_Months = ("P6M",)
-    One_Year = ("P1Y",)
-    Three_Years = ("P3Y",)
-    Five_Years = ("P5Y",)
+    One_Day = "P1D"
+    One_Week = "P1W"
+    One_Month = "P1M"
+    Three_Months = "P3M"
+    Six_Months = "P6M"
+    One_Year = "P1Y"
+    Three_Years = "P3Y"
+    Five_Years = "P5Y"
     Max = "P50Y"
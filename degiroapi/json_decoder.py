@@ -0,0 +1,70 @@
+import functools
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+Decoder = Callable[[Union[bytes, str]], Any]
+T = TypeVar("T")
+# The errors of a typed decoder for JSON that does not match its type, as opposed to content that is no JSON at all.
+VALIDATION_ERRORS: Tuple[Type[Exception], ...] = (msgspec.ValidationError,) if msgspec is not None else ()
+
+
+def _stdlib_loads(content: Union[bytes, str]) -> Any:
+    return json.loads(content)
+
+
+def get_decoder(backend: Optional[str] = None) -> Decoder:
+    """Get the JSON decoder of `backend`, or the fastest installed one of orjson, msgspec and the standard library."""
+    if backend is None:
+        backend = "orjson" if orjson is not None else "msgspec" if msgspec is not None else "json"
+    if backend == "orjson":
+        if orjson is None:
+            raise ImportError(
+                "The orjson backend requires orjson, install it with `pip install python-degiro[orjson]`."
+            )
+        return orjson.loads
+    if backend == "msgspec":
+        if msgspec is None:
+            raise ImportError(
+                "The msgspec backend requires msgspec, install it with `pip install python-degiro[msgspec]`."
+            )
+        return msgspec.json.decode
+    if backend == "json":
+        return _stdlib_loads
+    raise ValueError(f"Unknown JSON backend: {backend}")
+
+
+def decode_as(content: Union[bytes, str], type_: Type[T]) -> T:
+    """Decode JSON straight into a typed structure, like a msgspec.Struct, validating it on the way."""
+    if msgspec is None:
+        raise ImportError(
+            "Decoding into typed structures requires msgspec, install it with `pip install python-degiro[msgspec]`."
+        )
+    return msgspec.json.decode(content, type=type_)
+
+
+@functools.lru_cache(maxsize=None)
+def envelope_decoder(field: str, type_: Any) -> Decoder:
+    """Get a decoder of responses like `{field: [...]}`, which decodes the items of `field` straight into `type_`.
+
+    The other fields of the response are skipped without being decoded. The decoder returns `{field: items}`.
+    """
+    if msgspec is None:
+        raise ImportError(
+            "Decoding into typed structures requires msgspec, install it with `pip install python-degiro[msgspec]`."
+        )
+    decoder = msgspec.json.Decoder(msgspec.defstruct("Envelope", [(field, List[type_])]))  # type: ignore
+
+    def decode(content: Union[bytes, str]) -> Dict[str, List[Any]]:
+        return {field: getattr(decoder.decode(content), field)}
+
+    return decode
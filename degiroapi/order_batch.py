@@ -0,0 +1,41 @@
+from typing import NamedTuple, Optional, Union
+
+
+class OrderSpec(NamedTuple):
+    """An order to place with DeGiro.place_orders, with the arguments of DeGiro.buy_order and DeGiro.sell_order."""
+
+    buy_sell: str
+    order_type: int
+    product_id: str
+    time_type: int
+    size: int
+    limit: Optional[Union[int, float]] = None
+    stop_loss: Optional[Union[int, float]] = None
+
+
+class OrderResult(NamedTuple):
+    """The outcome of placing one order in a batch, `stage` tells whether the error came from the check or confirm."""
+
+    order: OrderSpec
+    confirmation_id: Optional[str]
+    order_id: Optional[str]
+    error: Optional[Exception]
+    stage: Optional[str]
+    check_seconds: float
+    confirm_seconds: Optional[float]
+
+    @property
+    def placed(self) -> bool:
+        return self.error is None
+
+
+class CancelResult(NamedTuple):
+    """The outcome of deleting one order in a batch."""
+
+    order_id: str
+    error: Optional[Exception]
+    seconds: float
+
+    @property
+    def deleted(self) -> bool:
+        return self.error is None
@@ -0,0 +1,170 @@
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Union
+
+from degiroapi.data_type import DataType
+from degiroapi.degiro import DeGiro
+from degiroapi.order_batch import CancelResult, OrderResult, OrderSpec
+from degiroapi.order_type import OrderType
+
+
+class OrderBook:
+    """An in-memory book of the open orders, indexed by order id and by product id.
+
+    The book is seeded by its first poll and kept up to date with the changes of the `orders` section of the update
+    endpoint. Orders placed, modified or deleted through the book are applied right away, without waiting for a poll.
+    An order that DeGiro confirmed without telling its id is kept under its confirmation id, until a poll brings a new
+    order for the same product, side and size, which replaces it.
+    """
+
+    def __init__(self, degiro: DeGiro):
+        self.__degiro = degiro
+        self.__lock = threading.Lock()
+        self.last_updated = 0
+        self.__orders: Dict[str, Dict] = {}
+        self.__by_product: Dict[str, Set[str]] = defaultdict(set)
+        self.__unconfirmed: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self.__orders)
+
+    def poll(self) -> List[Mapping]:
+        """Apply the changes to the open orders since the previous poll, returning the changed orders."""
+        return self.apply(self.__degiro.get_update({DataType.ORDERS: self.last_updated}).get(DataType.ORDERS))
+
+    def apply(self, orders: Optional[Mapping]) -> List[Mapping]:
+        """Apply an `orders` section of the update endpoint, e.g. one fetched with DeGiro.get_data_many."""
+        if not orders:
+            return []
+        changed: List[Mapping] = []
+        with self.__lock:
+            if self.last_updated == 0:
+                self.__orders.clear()
+                self.__by_product.clear()
+                self.__unconfirmed.clear()
+            self.last_updated = orders.get("lastUpdated", self.last_updated)
+            for item in orders.get("value", []):
+                order_id = str(item["id"])
+                if item.get("isRemoved"):
+                    if self.__remove(order_id):
+                        changed.append({"id": item["id"], "isRemoved": True})
+                    continue
+                new = order_id not in self.__orders
+                order = dict(self.__orders.get(order_id, {"id": item["id"]}))
+                for cell in item.get("value", []):
+                    if cell["name"] != "id":
+                        order[cell["name"]] = cell.get("value")
+                if new:
+                    self.__reconcile(order)
+                self.__put(order_id, order)
+                changed.append(dict(order))
+        return changed
+
+    def get(self, order_id: str) -> Optional[Mapping]:
+        with self.__lock:
+            order = self.__orders.get(str(order_id))
+            return dict(order) if order is not None else None
+
+    def open_orders(self, product_id: Optional[Union[int, str]] = None) -> List[Mapping]:
+        with self.__lock:
+            if product_id is None:
+                return [dict(order) for order in self.__orders.values()]
+            return [dict(self.__orders[order_id]) for order_id in self.__by_product.get(str(product_id), ())]
+
+    def place_orders(self, orders: Iterable[OrderSpec], max_workers: int = 10) -> List[OrderResult]:
+        """Place orders like DeGiro.place_orders, adding the placed ones to the book.
+
+        A placed order without an order id is added under its confirmation id, and replaced by the next poll.
+        """
+        results = self.__degiro.place_orders(orders, max_workers)
+        with self.__lock:
+            for result in results:
+                if result.placed:
+                    order_id = result.order_id or result.confirmation_id
+                    if result.order_id is None:
+                        self.__unconfirmed.add(str(order_id))
+                    order = result.order
+                    self.__put(
+                        str(order_id),
+                        {
+                            "id": order_id,
+                            "productId": order.product_id,
+                            "buysell": order.buy_sell[0],
+                            "orderTypeId": order.order_type,
+                            "orderTimeTypeId": order.time_type,
+                            "size": order.size,
+                            "price": order.limit,
+                            "stopPrice": order.stop_loss,
+                        },
+                    )
+        return results
+
+    def modify_order(
+        self,
+        order_type: int,
+        order_id: str,
+        product_id: str,
+        buy_sell: str,
+        time_type: int,
+        size: int,
+        limit: Optional[Union[int, float]] = None,
+    ) -> Mapping:
+        """Modify an order like DeGiro.modify_order, updating it in the book."""
+        response = self.__degiro.modify_order(order_type, order_id, product_id, buy_sell, time_type, size, limit)
+        with self.__lock:
+            order = dict(self.__orders.get(str(order_id), {"id": order_id}))
+            order.update(
+                {
+                    "productId": product_id,
+                    "buysell": buy_sell[0],
+                    "orderTypeId": order_type,
+                    "orderTimeTypeId": time_type,
+                    "size": size,
+                }
+            )
+            if order_type == OrderType.LIMIT:
+                order["price"] = limit
+            elif order_type == OrderType.STOP_LOSS:
+                order["stopPrice"] = limit
+            self.__put(str(order_id), order)
+        return response
+
+    def delete_order(self, order_id: str) -> Union[Mapping, List, str]:
+        """Delete an order like DeGiro.delete_order, removing it from the book."""
+        response = self.__degiro.delete_order(order_id)
+        with self.__lock:
+            self.__remove(str(order_id))
+        return response
+
+    def delete_orders(self, order_ids: Iterable[str], max_workers: int = 10) -> List[CancelResult]:
+        """Delete orders like DeGiro.delete_orders, removing the deleted ones from the book."""
+        results = self.__degiro.delete_orders(order_ids, max_workers)
+        with self.__lock:
+            for result in results:
+                if result.deleted:
+                    self.__remove(str(result.order_id))
+        return results
+
+    def __put(self, order_id: str, order: Dict) -> None:
+        previous = self.__orders.get(order_id)
+        if previous is not None:
+            self.__by_product[str(previous.get("productId"))].discard(order_id)
+        self.__orders[order_id] = order
+        self.__by_product[str(order.get("productId"))].add(order_id)
+
+    def __remove(self, order_id: str) -> bool:
+        order = self.__orders.pop(order_id, None)
+        self.__unconfirmed.discard(order_id)
+        if order is None:
+            return False
+        self.__by_product[str(order.get("productId"))].discard(order_id)
+        return True
+
+    def __reconcile(self, order: Mapping) -> None:
+        """Remove the order placed without an order id that `order`, new in a poll, turns out to be."""
+        for confirmation_id in list(self.__by_product.get(str(order.get("productId")), ())):
+            if confirmation_id in self.__unconfirmed:
+                placed = self.__orders[confirmation_id]
+                if placed["buysell"] == order.get("buysell") and float(placed["size"]) == float(order.get("size", 0)):
+                    self.__remove(confirmation_id)
+                    return
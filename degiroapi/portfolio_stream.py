@@ -0,0 +1,49 @@
+import time
+from typing import Dict, Iterator, List, Mapping
+
+from degiroapi.data_type import DataType
+from degiroapi.degiro import DeGiro
+from degiroapi.position import parse_position, Position
+
+
+class PortfolioStream:
+    """Keeps an in-memory portfolio up to date by polling DeGiro for the changes since the previous poll."""
+
+    def __init__(self, degiro: DeGiro):
+        self.__degiro = degiro
+        self.last_updated = 0
+        self.__positions: Dict[str, Position] = {}
+
+    def positions(self, filter_zero: bool = False) -> List[Mapping]:
+        return [p.to_dict() for p in self.__positions.values() if not filter_zero or not p.empty]
+
+    def poll(self) -> List[Mapping]:
+        """Apply the changes since the previous poll and return the changed positions.
+
+        The first poll loads the full portfolio. A position that disappeared is returned as its id with `isRemoved`.
+        """
+        portfolio = self.__degiro.get_update({DataType.PORTFOLIO: self.last_updated}).get(DataType.PORTFOLIO)
+        if not portfolio:
+            return []
+        if self.last_updated == 0:
+            self.__positions.clear()
+        self.last_updated = portfolio.get("lastUpdated", self.last_updated)
+
+        changed: List[Mapping] = []
+        for item in portfolio.get("value", []):
+            position_id = str(item["id"])
+            if item.get("isRemoved"):
+                if self.__positions.pop(position_id, None) is not None:
+                    changed.append({"id": item["id"], "isRemoved": True})
+                continue
+            position = self.__positions[position_id] = parse_position(item, self.__positions.get(position_id))
+            changed.append(position.to_dict())
+        return changed
+
+    def watch(self, poll_interval: float = 5.0) -> Iterator[List[Mapping]]:
+        """Poll forever, yielding the changed positions whenever there are any."""
+        while True:
+            changed = self.poll()
+            if changed:
+                yield changed
+            time.sleep(poll_interval)
@@ -0,0 +1,63 @@
+from typing import Any, Dict, Iterator, List, Mapping, NamedTuple, Optional
+
+# The names of the cells of a portfolio row that are kept, in the order of the Position fields after the id.
+POSITION_FIELDS = ("positionType", "size", "price", "value", "breakEvenPrice")
+_FIELD_INDEX = {name: index for index, name in enumerate(POSITION_FIELDS, start=1)}
+_DICT_KEYS = ("id",) + POSITION_FIELDS
+_SIZE_INDEX = _FIELD_INDEX["size"]
+
+
+class Position(NamedTuple):
+    """A position in the portfolio of DeGiro."""
+
+    id: str
+    position_type: Optional[str] = None
+    size: Optional[float] = None
+    price: Optional[float] = None
+    value: Optional[float] = None
+    break_even_price: Optional[float] = None
+
+    @property
+    def empty(self) -> bool:
+        """Whether the position was closed, DeGiro keeps closed positions in the portfolio with a size of 0."""
+        return self.size == 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the position in the dict format of DeGiro.filter_portfolio."""
+        return dict(zip(_DICT_KEYS, self))
+
+
+def parse_position(item: Mapping, previous: Optional[Position] = None) -> Position:
+    """Parse a row of the portfolio section, applying it to `previous` when the row only holds the changed cells."""
+    fields = list(previous) if previous is not None else [item["id"], None, None, None, None, None]
+    return Position._make(_apply_cells(item, fields))
+
+
+def parse_positions(portfolio: Mapping, filter_zero: bool = False) -> List[Position]:
+    """Parse the portfolio section of an update in a single pass, leaving out empty positions if `filter_zero`."""
+    return [Position._make(fields) for fields in _parse_rows(portfolio, filter_zero)]
+
+
+def parse_position_dicts(portfolio: Mapping, filter_zero: bool = False) -> List[Mapping]:
+    """Parse the portfolio section like parse_positions, into the dicts of Position.to_dict."""
+    return [dict(zip(_DICT_KEYS, fields)) for fields in _parse_rows(portfolio, filter_zero)]
+
+
+def _parse_rows(portfolio: Mapping, filter_zero: bool) -> Iterator[List[Any]]:
+    """Yield the fields of each row of the portfolio section, in the order of the Position fields.
+
+    This is the one parser behind parse_positions and parse_position_dicts, an empty position is one of Position.empty.
+    """
+    for item in portfolio["portfolio"]["value"]:
+        fields = _apply_cells(item, [item["id"], None, None, None, None, None])
+        if not filter_zero or fields[_SIZE_INDEX] != 0.0:
+            yield fields
+
+
+def _apply_cells(item: Mapping, fields: List[Any]) -> List[Any]:
+    field_index = _FIELD_INDEX
+    for cell in item.get("value", ()):
+        index = field_index.get(cell["name"])
+        if index is not None:
+            fields[index] = cell.get("value")
+    return fields
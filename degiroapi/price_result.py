@@ -0,0 +1,13 @@
+from typing import List, Mapping, NamedTuple, Optional
+
+
+class PriceResult(NamedTuple):
+    """The price data of one product in a bulk request, or the error that occurred while fetching it."""
+
+    product_id: str
+    series: Optional[List[Mapping]]
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
@@ -0,0 +1,90 @@
+import re
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Tuple
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+_RESOLUTION = re.compile(r"^P(?:(\d+)Y)?(?:(\d+)M)?(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$")
+_UTC_OFFSET = re.compile(r"(Z|[+-]\d{2}:?\d{2})$")
+_COLUMNS = {"time": ("price",), "ohlc": ("open", "high", "low", "close")}
+
+
+class PriceSeries(NamedTuple):
+    """Columnar price data of one chart series, with a datetime64 timestamp and a float64 array per column."""
+
+    series_id: str
+    series_type: str
+    times: Any
+    columns: Dict[str, Any]
+
+    def to_dataframe(self) -> Any:
+        import pandas
+
+        return pandas.DataFrame(self.columns, index=pandas.DatetimeIndex(self.times, name="time"))
+
+
+def decode_series(series: Mapping) -> PriceSeries:
+    """Decode a `time` or `ohlc` series of real_time_price into columnar arrays, without a Python loop per point."""
+    if numpy is None:
+        raise ImportError("Decoding price series requires numpy, install it with `pip install python-degiro[numpy]`.")
+    if series.get("type") not in _COLUMNS:
+        raise ValueError(f"Can not decode series of type {series.get('type')!r}.")
+
+    names = _COLUMNS[series["type"]]
+    data = numpy.asarray(series["data"], dtype=numpy.float64).reshape(-1, len(names) + 1)
+    start, resolution = series["times"].split("/")
+    unit, step = _parse_resolution(resolution)
+
+    offsets = numpy.rint(data[:, 0] * step).astype(numpy.int64)
+    if unit == "M":
+        times = _add_months(_parse_start(start), offsets)
+    else:
+        times = _parse_start(start) + offsets.astype("timedelta64[s]")
+
+    columns = {name: data[:, position + 1] for position, name in enumerate(names)}
+    return PriceSeries(series.get("id", ""), series["type"], times, columns)
+
+
+def decode_chart(series: Iterable[Mapping]) -> List[PriceSeries]:
+    """Decode every `time` and `ohlc` series of a chart response, skipping the quote object."""
+    return [decode_series(item) for item in series if item.get("type") in _COLUMNS]
+
+
+def _add_months(start: Any, offsets: Any) -> Any:
+    """Step `offsets` months from `start`, clamping the day to the last day of shorter months like 31 January does."""
+    start_day = start.astype("datetime64[D]")
+    start_month = start.astype("datetime64[M]")
+    day = (start_day - start_month.astype("datetime64[D]")).astype(numpy.int64)
+    months = start_month + offsets.astype("timedelta64[M]")
+    month_days = ((months + 1).astype("datetime64[D]") - months.astype("datetime64[D]")).astype(numpy.int64)
+    days = months.astype("datetime64[D]") + numpy.minimum(day, month_days - 1).astype("timedelta64[D]")
+    return days.astype("datetime64[s]") + (start - start_day.astype("datetime64[s]"))
+
+
+def _parse_start(start: str) -> Any:
+    """Parse the start of a series as a UTC datetime64, the vwd timestamps may carry a UTC offset."""
+    match = _UTC_OFFSET.search(start)
+    if not match:
+        return numpy.datetime64(start, "s")
+    offset = match.group(1)
+    moment = numpy.datetime64(start[: match.start()], "s")
+    if offset == "Z":
+        return moment
+    sign = -1 if offset[0] == "+" else 1
+    hours, minutes = int(offset[1:3]), int(offset[-2:])
+    return moment + numpy.timedelta64(sign * (hours * 3600 + minutes * 60), "s")
+
+
+def _parse_resolution(resolution: str) -> Tuple[str, int]:
+    """Parse an ISO 8601 duration into either a number of months ("M") or a number of seconds ("s")."""
+    match = _RESOLUTION.match(resolution)
+    if not match or resolution in ("P", "PT"):
+        raise ValueError(f"Unknown series resolution {resolution!r}.")
+    years, months, weeks, days, hours, minutes, seconds = (int(part) if part else 0 for part in match.groups())
+    if years or months:
+        if weeks or days or hours or minutes or seconds:
+            raise ValueError(f"Unsupported series resolution {resolution!r}.")
+        return "M", years * 12 + months
+    return "s", ((weeks * 7 + days) * 24 + hours) * 3600 + minutes * 60 + seconds
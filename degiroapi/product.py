@@ -1,54 +1,60 @@
 import datetime
-from typing import Mapping, Optional
+from typing import Any, Mapping, Optional
 
+from degiroapi.record import Record
 
-class Product:
+_UNSET = object()
+
+
+class Product(Record):
     """A data class for a stock/product of DeGiro."""
 
-    def __init__(self, product: Mapping[str, str]):
-        self.__id = product["id"]
-        self.__name = product["name"]
-        self.__isin = product["isin"]
-        self.__symbol = product["symbol"]
-        self.__currency = product["currency"]
-        self.__product_type = product["productTypeId"]
-        self.__tradable = product["tradable"]
-        self.__close_price = product.get("closePrice")
-        cpd = product.get("closePriceDate")
-        self.__close_price_date = datetime.datetime.strptime(cpd, "%Y-%m-%d").date() if cpd else None
+    __slots__ = ("__close_price_date",)
+
+    def __init__(self, product: Mapping[str, Any]):
+        super().__init__(product)
+        object.__setattr__(self, "_Product__close_price_date", _UNSET)
 
     @property
     def id(self) -> str:
-        return self.__id
+        return self.raw["id"]
 
     @property
     def name(self) -> str:
-        return self.__name
+        return self.raw["name"]
 
     @property
     def isin(self) -> str:
-        return self.__isin
+        return self.raw["isin"]
 
     @property
     def symbol(self) -> str:
-        return self.__symbol
+        return self.raw["symbol"]
+
+    @property
+    def exchange_id(self) -> Optional[str]:
+        return self.raw.get("exchangeId")
 
     @property
     def currency(self) -> str:
-        return self.__currency
+        return self.raw["currency"]
 
     @property
     def product_type(self) -> str:
-        return self.__product_type
+        return self.raw["productTypeId"]
 
     @property
     def tradable(self) -> str:
-        return self.__tradable
+        return self.raw["tradable"]
 
     @property
     def close_price(self) -> Optional[str]:
-        return self.__close_price
+        return self.raw.get("closePrice")
 
     @property
     def close_price_date(self) -> Optional[datetime.date]:
-        return self.__close_price_date
+        if self.__close_price_date is _UNSET:
+            cpd = self.raw.get("closePriceDate")
+            close_price_date = datetime.datetime.strptime(cpd, "%Y-%m-%d").date() if cpd else None
+            object.__setattr__(self, "_Product__close_price_date", close_price_date)
+        return self.__close_price_date  # type: ignore
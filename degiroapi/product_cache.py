@@ -0,0 +1,84 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Mapping, Optional, Tuple, Union
+
+
+class ProductCache:
+    """A bounded LRU cache of the vwd identifiers of products, and optionally of their info with a time to live.
+
+    The info holds prices like closePrice, so it is only cached with a `ttl` above 0 seconds. By default only the vwd
+    identifiers are cached. The info is copied in and out, so callers cannot change the cached info.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: float = 0.0, clock: Callable[[], float] = time.monotonic):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.__clock = clock
+        self.__lock = threading.Lock()
+        self.__products: "OrderedDict[str, Tuple[float, Mapping]]" = OrderedDict()
+        # The vwd identifiers of a product never change, so they are kept apart from the info and do not expire.
+        self.__vwd_identifiers: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.vwd_hits = 0
+        self.vwd_misses = 0
+
+    def get(self, product_id: Union[int, str]) -> Optional[Mapping]:
+        key = str(product_id)
+        with self.__lock:
+            entry = self.__products.get(key)
+            if entry is None or self.__clock() - entry[0] > self.ttl:
+                if entry is not None:
+                    del self.__products[key]
+                self.misses += 1
+                return None
+            self.__products.move_to_end(key)
+            self.hits += 1
+            return dict(entry[1])
+
+    def put(self, product_id: Union[int, str], product_info: Mapping) -> None:
+        key = str(product_id)
+        with self.__lock:
+            if self.ttl > 0:
+                self.__products[key] = (self.__clock(), dict(product_info))
+                self.__products.move_to_end(key)
+                self.__evict(self.__products)
+            if "vwdId" in product_info and "vwdIdentifierType" in product_info:
+                self.__vwd_identifiers[key] = (product_info["vwdIdentifierType"], product_info["vwdId"])
+                self.__vwd_identifiers.move_to_end(key)
+                self.__evict(self.__vwd_identifiers)
+
+    def get_vwd_identifier(self, product_id: Union[int, str]) -> Optional[Tuple[str, str]]:
+        """Get the (vwdIdentifierType, vwdId) of a product without going through the info cache."""
+        key = str(product_id)
+        with self.__lock:
+            identifier = self.__vwd_identifiers.get(key)
+            if identifier is None:
+                self.vwd_misses += 1
+                return None
+            self.__vwd_identifiers.move_to_end(key)
+            self.vwd_hits += 1
+            return identifier
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__products.clear()
+            self.__vwd_identifiers.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self.__products),
+            "hits": self.hits,
+            "misses": self.misses,
+            "vwd_size": len(self.__vwd_identifiers),
+            "vwd_hits": self.vwd_hits,
+            "vwd_misses": self.vwd_misses,
+        }
+
+    def __len__(self) -> int:
+        return len(self.__products)
+
+    def __evict(self, entries: "OrderedDict") -> None:
+        while len(entries) > self.max_size:
+            entries.popitem(last=False)
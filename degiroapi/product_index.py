@@ -0,0 +1,133 @@
+import bisect
+import json
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
+
+from degiroapi.degiro import DeGiro
+from degiroapi.product import Product
+
+
+class ProductIndex:
+    """An in-memory index of products to look them up by id, ISIN, symbol or name without a request.
+
+    When a `degiro` client is given, lookups by id, ISIN or symbol that miss are resolved through the API and the
+    products that come back are added to the index.
+    """
+
+    def __init__(self, degiro: Optional[DeGiro] = None):
+        self.__degiro = degiro
+        self.__lock = threading.RLock()
+        self.__by_id: Dict[str, Product] = {}
+        self.__by_isin: Dict[str, Set[str]] = defaultdict(set)
+        self.__by_symbol: Dict[Tuple[str, Optional[str]], Set[str]] = defaultdict(set)
+        self.__by_trigram: Dict[str, Set[str]] = defaultdict(set)
+        self.__names: List[Tuple[str, str]] = []
+        self.__names_sorted = True
+
+    def __len__(self) -> int:
+        return len(self.__by_id)
+
+    def __contains__(self, product_id: Union[int, str]) -> bool:
+        return str(product_id) in self.__by_id
+
+    def add(self, products: Iterable[Union[Mapping, Product]]) -> None:
+        with self.__lock:
+            for product in products:
+                if not isinstance(product, Product):
+                    product = Product(product)
+                product_id = str(product.id)
+                if product_id in self.__by_id:
+                    continue
+                # Not every product has an ISIN, symbol or name, it is only indexed on the fields it has.
+                isin, symbol, name = product.get("isin"), product.get("symbol"), product.get("name")
+                if isin:
+                    self.__by_isin[isin].add(product_id)
+                if symbol:
+                    self.__by_symbol[(symbol.upper(), None)].add(product_id)
+                    self.__by_symbol[(symbol.upper(), product.exchange_id)].add(product_id)
+                if name:
+                    name = name.lower()
+                    self.__names.append((name, product_id))
+                    self.__names_sorted = False
+                    for trigram in _trigrams(name):
+                        self.__by_trigram[trigram].add(product_id)
+                self.__by_id[product_id] = product
+
+    def load_stock_list(self, index_id: int, stock_country_id: int) -> None:
+        self.add(self.__client().iter_stock_list(index_id, stock_country_id))
+
+    def load_search(self, search_text: str, limit: int = 100) -> None:
+        self.add(self.__client().search_products(search_text, limit))
+
+    def save(self, path: str) -> None:
+        """Save a snapshot of the index, which can be loaded again with load."""
+        with self.__lock, open(path, "w") as file:
+            json.dump([dict(product.raw) for product in self.__by_id.values()], file)
+
+    def load(self, path: str) -> None:
+        with open(path) as file:
+            self.add(json.load(file))
+
+    def by_id(self, product_id: Union[int, str]) -> Optional[Product]:
+        product = self.__by_id.get(str(product_id))
+        if product is None and self.__degiro is not None:
+            self.add(self.__degiro.products_info([product_id]).values())
+            product = self.__by_id.get(str(product_id))
+        return product
+
+    def by_isin(self, isin: str) -> List[Product]:
+        """Get the listings of an ISIN on all exchanges."""
+        return self.__lookup(self.__by_isin, isin, isin)
+
+    def by_symbol(self, symbol: str, exchange_id: Optional[str] = None) -> List[Product]:
+        return self.__lookup(self.__by_symbol, (symbol.upper(), exchange_id), symbol)
+
+    def by_name_prefix(self, prefix: str, limit: int = 10) -> List[Product]:
+        with self.__lock:
+            if not self.__names_sorted:
+                self.__names.sort()
+                self.__names_sorted = True
+            prefix = prefix.lower()
+            products: List[Product] = []
+            position = bisect.bisect_left(self.__names, (prefix, ""))
+            while position < len(self.__names) and len(products) < limit:
+                name, product_id = self.__names[position]
+                if not name.startswith(prefix):
+                    break
+                products.append(self.__by_id[product_id])
+                position += 1
+            return products
+
+    def fuzzy_search(self, text: str, limit: int = 10) -> List[Product]:
+        """Get the products of which the name shares the most trigrams with `text`."""
+        trigrams = _trigrams(text.lower())
+        shared: Dict[str, int] = defaultdict(int)
+        with self.__lock:
+            for trigram in trigrams:
+                for product_id in self.__by_trigram.get(trigram, ()):
+                    shared[product_id] += 1
+            scores = []
+            for product_id, count in shared.items():
+                name_trigrams = len(_trigrams(self.__by_id[product_id].name.lower()))
+                scores.append((count / (len(trigrams) + name_trigrams - count), product_id))
+            scores.sort(key=lambda score: (-score[0], score[1]))
+            return [self.__by_id[product_id] for _, product_id in scores[:limit]]
+
+    def __lookup(self, index: Mapping, key: object, search_text: str) -> List[Product]:
+        product_ids = index.get(key)
+        if not product_ids and self.__degiro is not None:
+            self.load_search(search_text)
+            product_ids = index.get(key)
+        with self.__lock:
+            return [self.__by_id[product_id] for product_id in sorted(product_ids or ())]
+
+    def __client(self) -> DeGiro:
+        if self.__degiro is None:
+            raise ValueError("This ProductIndex was created without a DeGiro client.")
+        return self.__degiro
+
+
+def _trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
@@ -0,0 +1,162 @@
+import asyncio
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from degiroapi.degiro import DeGiro
+from degiroapi.interval_type import IntervalType
+from degiroapi.price_result import PriceResult
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """A subscription to the quotes of one product, returned by QuoteService.subscribe."""
+
+    __slots__ = ("product_id", "callback")
+
+    def __init__(self, product_id: str, callback: Optional[Callable[[PriceResult], Any]]):
+        self.product_id = product_id
+        self.callback = callback
+
+
+class QuoteService:
+    """Polls the quotes of all subscribed products on one background schedule and hands them to the subscribers.
+
+    Each product is fetched once per poll, however many subscribers it has, and all products are fetched together in
+    batched chart requests. A product is polled as long as at least one subscription to it is open. An exception raised
+    by a callback is passed to `on_callback_error`, or logged when it is not given.
+    """
+
+    def __init__(
+        self,
+        degiro: DeGiro,
+        interval: str = IntervalType.One_Day,
+        poll_interval: float = 5.0,
+        batch_size: int = DeGiro.PRICE_DATA_BATCH_SIZE,
+        on_callback_error: Optional[Callable[[Subscription, Exception], Any]] = None,
+    ):
+        self.__degiro = degiro
+        self.interval = interval
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.__on_callback_error = on_callback_error
+        self.__lock = threading.Lock()
+        self.__subscriptions: Dict[str, List[Subscription]] = {}
+        self.__latest: Dict[str, PriceResult] = {}
+        self.__stopped = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "QuoteService":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def subscribe(
+        self, product_id: Union[int, str], callback: Optional[Callable[[PriceResult], Any]] = None
+    ) -> Subscription:
+        """Subscribe to the quotes of a product, `callback` is called from the polling thread with each PriceResult.
+
+        Without a callback the product is still polled, and its quote is available through `latest`.
+        """
+        subscription = Subscription(str(product_id), callback)
+        with self.__lock:
+            self.__subscriptions.setdefault(subscription.product_id, []).append(subscription)
+        return subscription
+
+    def subscribe_queue(
+        self,
+        product_id: Union[int, str],
+        queue: "asyncio.Queue",
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> Subscription:
+        """Subscribe to the quotes of a product, putting each PriceResult on an asyncio queue of `loop`.
+
+        Without a `loop` the queue belongs to the running loop, so it must then be called from a coroutine.
+        """
+        target = loop or asyncio.get_running_loop()
+        return self.subscribe(product_id, lambda result: target.call_soon_threadsafe(queue.put_nowait, result))
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Close a subscription, a product without open subscriptions is no longer polled."""
+        with self.__lock:
+            subscriptions = self.__subscriptions.get(subscription.product_id, [])
+            if subscription in subscriptions:
+                subscriptions.remove(subscription)
+            if not subscriptions:
+                self.__subscriptions.pop(subscription.product_id, None)
+                self.__latest.pop(subscription.product_id, None)
+
+    def subscriber_count(self, product_id: Union[int, str]) -> int:
+        with self.__lock:
+            return len(self.__subscriptions.get(str(product_id), ()))
+
+    def product_ids(self) -> List[str]:
+        with self.__lock:
+            return list(self.__subscriptions)
+
+    def latest(self, product_id: Union[int, str]) -> Optional[PriceResult]:
+        """The PriceResult of the last poll of a subscribed product, None before its first poll."""
+        with self.__lock:
+            return self.__latest.get(str(product_id))
+
+    def poll(self) -> List[PriceResult]:
+        """Fetch the quotes of all subscribed products at once and hand them to the subscribers."""
+        product_ids = self.product_ids()
+        if not product_ids:
+            return []
+        results = self.__fetch(product_ids)
+        with self.__lock:
+            for result in results:
+                if result.product_id in self.__subscriptions:
+                    self.__latest[result.product_id] = result
+            deliveries = [
+                (subscription, result)
+                for result in results
+                for subscription in self.__subscriptions.get(result.product_id, ())
+                if subscription.callback is not None
+            ]
+        for subscription, result in deliveries:
+            try:
+                subscription.callback(result)  # type: ignore
+            except Exception as exc:
+                if self.__on_callback_error is None:
+                    logger.exception("The callback of a subscription to product %s failed.", subscription.product_id)
+                else:
+                    self.__on_callback_error(subscription, exc)
+        return results
+
+    def start(self) -> None:
+        """Start polling in a background thread."""
+        if self.__thread is not None and self.__thread.is_alive():
+            return
+        self.__stopped.clear()
+        self.__thread = threading.Thread(target=self.__run, name="degiro-quotes", daemon=True)
+        self.__thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the background thread, waiting for a poll that is in progress."""
+        self.__stopped.set()
+        if self.__thread is not None:
+            self.__thread.join(timeout)
+            self.__thread = None
+
+    def __run(self) -> None:
+        while not self.__stopped.is_set():
+            self.poll()
+            self.__stopped.wait(self.poll_interval)
+
+    def __fetch(self, product_ids: Iterable[str]) -> List[PriceResult]:
+        product_ids = list(product_ids)
+        try:
+            prices = self.__degiro.combined_real_time_prices(product_ids, self.interval, self.batch_size)
+        except Exception as exc:
+            return [PriceResult(product_id, None, exc) for product_id in product_ids]
+        return [
+            PriceResult(product_id, prices[product_id])
+            if product_id in prices
+            else PriceResult(product_id, None, KeyError(f"Product {product_id} has no price data."))
+            for product_id in product_ids
+        ]
@@ -0,0 +1,132 @@
+import heapq
+import itertools
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Mapping, Optional, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+
+class Priority:
+    """The priority of a request that has to wait for the rate limiter, higher goes first."""
+
+    LOW = 0
+    NORMAL = 1
+    HIGH = 2
+
+
+class TokenBucket:
+    """A token bucket that holds at most `capacity` tokens and refills `rate` tokens per second."""
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.__clock = clock
+        self.__tokens = capacity
+        self.__updated = clock()
+        self.__lock = threading.Lock()
+
+    def try_acquire(self) -> float:
+        """Take a token, returns 0 when that succeeded and otherwise the seconds until a token is available."""
+        with self.__lock:
+            now = self.__clock()
+            self.__tokens, wait = _take_token(self.__tokens, now - self.__updated, self.rate, self.capacity)
+            self.__updated = now
+            return wait
+
+
+class FileTokenBucket:
+    """A token bucket kept in a locked file, so that the processes on one host share the same budget."""
+
+    def __init__(self, path: str, rate: float, capacity: float):
+        if fcntl is None:
+            raise RuntimeError("A FileTokenBucket requires fcntl, which is not available on this platform.")
+        self.path = path
+        self.rate = rate
+        self.capacity = capacity
+
+    def try_acquire(self) -> float:
+        """Take a token, returns 0 when that succeeded and otherwise the seconds until a token is available."""
+        with os.fdopen(os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600), "r+") as file:
+            fcntl.flock(file, fcntl.LOCK_EX)
+            try:
+                now = time.time()
+                try:
+                    state = json.loads(file.read())
+                    tokens, elapsed = state["tokens"], now - state["updated"]
+                except (ValueError, KeyError):
+                    tokens, elapsed = self.capacity, 0.0
+                tokens, wait = _take_token(tokens, elapsed, self.rate, self.capacity)
+                file.seek(0)
+                file.truncate()
+                file.write(json.dumps({"tokens": tokens, "updated": now}))
+                file.flush()
+                return wait
+            finally:
+                fcntl.flock(file, fcntl.LOCK_UN)
+
+
+Bucket = Union[TokenBucket, FileTokenBucket]
+
+
+class RateLimiter:
+    """Limits the requests per endpoint family, letting the waiting request with the highest priority go first."""
+
+    def __init__(self, buckets: Mapping[str, Bucket]):
+        self.__buckets = dict(buckets)
+        self.__condition = threading.Condition()
+        self.__queues: Dict[str, List[Tuple[int, int]]] = {}
+        self.__counter = itertools.count()
+
+    @classmethod
+    def default(cls, shared_directory: Optional[str] = None) -> "RateLimiter":
+        """Create a limiter with conservative budgets per family, shared through files in `shared_directory`."""
+        budgets = {
+            "login": (0.2, 3),
+            "product_search": (5, 10),
+            "reporting": (2, 5),
+            "trading": (5, 10),
+            "vwd": (10, 20),
+        }
+        buckets: Dict[str, Bucket] = {}
+        for family, (rate, capacity) in budgets.items():
+            if shared_directory is None:
+                buckets[family] = TokenBucket(rate, capacity)
+            else:
+                path = os.path.join(shared_directory, f"degiro-{family}.bucket")
+                buckets[family] = FileTokenBucket(path, rate, capacity)
+        return cls(buckets)
+
+    def acquire(self, family: str, priority: int = Priority.NORMAL) -> None:
+        """Block until the bucket of `family` hands out a token, families without a bucket are not limited."""
+        bucket = self.__buckets.get(family)
+        if bucket is None:
+            return
+        with self.__condition:
+            ticket = (-priority, next(self.__counter))
+            queue = self.__queues.setdefault(family, [])
+            heapq.heappush(queue, ticket)
+            try:
+                while True:
+                    wait: Optional[float] = None
+                    if queue[0] == ticket:
+                        wait = bucket.try_acquire()
+                        if wait <= 0:
+                            return
+                    self.__condition.wait(wait)
+            finally:
+                queue.remove(ticket)
+                heapq.heapify(queue)
+                self.__condition.notify_all()
+
+
+def _take_token(tokens: float, elapsed: float, rate: float, capacity: float) -> Tuple[float, float]:
+    tokens = min(capacity, tokens + max(elapsed, 0.0) * rate)
+    if tokens >= 1:
+        return tokens - 1, 0.0
+    return tokens, (1 - tokens) / rate
@@ -0,0 +1,64 @@
+import functools
+import types
+from typing import Any, Iterable, List, Mapping, Type, TypeVar
+
+RecordType = TypeVar("RecordType", bound="Record")
+
+
+class Record:
+    """An immutable, slotted wrapper around a mapping returned by DeGiro.
+
+    The mapping is kept behind a read-only `types.MappingProxyType`, which `raw` returns.
+    Every field of the mapping is available as snake_case attribute, e.g. `record.vwd_id` returns the `vwdId` field.
+    Fields are only looked up or decoded when they are accessed.
+    """
+
+    __slots__ = ("__raw",)
+
+    def __init__(self, raw: Mapping[str, Any]):
+        object.__setattr__(self, "_Record__raw", types.MappingProxyType(raw))
+
+    @classmethod
+    def from_list(cls: Type[RecordType], raws: Iterable[Mapping[str, Any]]) -> List[RecordType]:
+        return [cls(raw) for raw in raws]
+
+    @property
+    def raw(self) -> Mapping[str, Any]:
+        return self.__raw
+
+    def get(self, field: str, default: Any = None) -> Any:
+        return self.__raw.get(field, default)
+
+    def __getitem__(self, field: str) -> Any:
+        return self.__raw[field]
+
+    def __getattr__(self, name: str) -> Any:
+        if not name.startswith("_"):
+            field = _camel_case(name)
+            if field in self.__raw:
+                return self.__raw[field]
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__!r} object is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__!r} object is immutable")
+
+    def __reduce__(self) -> Any:
+        return type(self), (dict(self.__raw),)
+
+    def __eq__(self, other: object) -> bool:
+        return type(other) is type(self) and other.raw == self.__raw  # type: ignore
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.__raw.get("id")))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.__raw)!r})"
+
+
+@functools.lru_cache(maxsize=1024)
+def _camel_case(name: str) -> str:
+    first, *rest = name.split("_")
+    return first + "".join(part[:1].upper() + part[1:] for part in rest)
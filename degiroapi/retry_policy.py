@@ -0,0 +1,21 @@
+import random
+from typing import FrozenSet, NamedTuple
+
+
+class RetryPolicy(NamedTuple):
+    """How often a failed request is retried, and how long to back off between the attempts."""
+
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    retry_on_status: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    retry_connection_errors: bool = True
+
+    def backoff(self, attempt: int) -> float:
+        """Get the exponential backoff with full jitter before retry number `attempt`, counting from 0."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+
+NO_RETRY = RetryPolicy(max_retries=0, retry_connection_errors=False)
+# For requests that must never run twice, only retry when DeGiro certainly did not process the request.
+NON_IDEMPOTENT = RetryPolicy(retry_on_status=frozenset({429}), retry_connection_errors=False)
@@ -0,0 +1,87 @@
+import asyncio
+import json
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+def flight_key(*parts: Any) -> str:
+    """Build a canonical key of the parts of a call, so that equal payloads give equal keys whatever their key order."""
+    return json.dumps(parts, sort_keys=True, default=repr)
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Any = None
+
+
+class SingleFlight:
+    """Merges concurrent calls with the same key, so that only the first one runs and the others share its outcome.
+
+    The callers that joined a call get the very same result object, or the same exception.
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__calls: Dict[Hashable, _Call] = {}
+        self.calls = 0
+        self.merged = 0
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        with self.__lock:
+            call = self.__calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self.__calls[key] = _Call()
+                self.calls += 1
+            else:
+                self.merged += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self.__lock:
+                del self.__calls[key]
+            call.done.set()
+
+    def stats(self) -> Dict[str, int]:
+        return {"in_flight": len(self.__calls), "calls": self.calls, "merged": self.merged}
+
+
+class AsyncSingleFlight:
+    """The asyncio counterpart of SingleFlight, for coroutines running on one event loop.
+
+    A caller that is cancelled while waiting does not cancel the shared call of the other callers.
+    """
+
+    def __init__(self) -> None:
+        self.__futures: Dict[Hashable, "asyncio.Future"] = {}
+        self.calls = 0
+        self.merged = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        future = self.__futures.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func())
+            self.__futures[key] = future
+            future.add_done_callback(lambda _: self.__futures.pop(key, None))
+            self.calls += 1
+        else:
+            self.merged += 1
+        return await asyncio.shield(future)
+
+    def stats(self) -> Dict[str, int]:
+        return {"in_flight": len(self.__futures), "calls": self.calls, "merged": self.merged}
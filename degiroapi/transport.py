@@ -0,0 +1,222 @@
+import abc
+import json
+import threading
+from collections import defaultdict, deque
+from typing import AbstractSet, Any, Deque, Dict, Iterable, List, Mapping, Optional
+
+import requests
+
+# The values of these fields are redacted from cassettes: they are left out of recorded requests and ignored when
+# matching them on replay, and replaced by placeholders in recorded responses. They cover the credentials, the session
+# and the account, and the personal data of the client info.
+SECRET_FIELDS = frozenset(
+    {
+        "sessionId",
+        "password",
+        "oneTimePassword",
+        "userToken",
+        "JSESSIONID",
+        "username",
+        "intAccount",
+        "clientId",
+        "loggedInPersonId",
+        "displayName",
+        "email",
+        "firstName",
+        "lastName",
+        "dateOfBirth",
+        "placeOfBirth",
+        "streetAddress",
+        "streetAddressNumber",
+        "zip",
+        "city",
+        "cellphoneNumber",
+        "iban",
+        "bic",
+        "bankAccountId",
+    }
+)
+# The response headers that are left out of cassettes.
+_SECRET_HEADERS = frozenset({"set-cookie"})
+
+
+class Transport(abc.ABC):
+    """Sends the HTTP requests of a DeGiro client, see DeGiro.transport."""
+
+    @abc.abstractmethod
+    def send(self, method: str, url: str, **kwargs: Any) -> Any:
+        """Send a request with the keyword arguments of requests.Session.request, returning a response."""
+
+
+class RequestsTransport(Transport):
+    """Sends the requests over a requests.Session, which is the default transport."""
+
+    def __init__(self, session: requests.Session):
+        self.session = session
+
+    def send(self, method: str, url: str, **kwargs: Any) -> Any:
+        return self.session.request(method, url, **kwargs)
+
+
+class RecordedResponse:
+    """A response that was recorded in a cassette, with the attributes of requests.Response that DeGiro uses."""
+
+    def __init__(self, status_code: int, content: bytes, headers: Optional[Mapping[str, str]] = None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = requests.structures.CaseInsensitiveDict(headers or {})
+        self.request = None
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class RecordingTransport(Transport):
+    """Sends requests through another transport and records the interactions, to be saved as a cassette file.
+
+    The values of the `secret_fields` are left out of the recorded requests and replaced by placeholders in the JSON
+    of the recorded responses, and cookies are not recorded. The values that were redacted, like the account id, are
+    replaced by their placeholders in the paths of the recorded urls too, so that a client replaying the cassette sends
+    the same urls.
+    """
+
+    def __init__(self, transport: Transport, cassette_path: str, secret_fields: Optional[Iterable[str]] = None):
+        self.transport = transport
+        self.cassette_path = cassette_path
+        self.secret_fields = frozenset(SECRET_FIELDS if secret_fields is None else secret_fields)
+        self.__lock = threading.Lock()
+        self.__interactions: List[Dict[str, Any]] = []
+        self.__placeholders: Dict[str, str] = {}
+
+    def send(self, method: str, url: str, **kwargs: Any) -> Any:
+        response = self.transport.send(method, url, **kwargs)
+        with self.__lock:
+            for name in ("params", "json", "data", "cookies"):
+                self.__collect(_load(kwargs.get(name)))
+            body = response.content.decode("utf-8", errors="replace")
+            try:
+                content = json.loads(body)
+            except ValueError:
+                pass
+            else:
+                self.__collect(content)
+                body = json.dumps(_placeholders(content, self.secret_fields))
+            self.__interactions.append(
+                {
+                    "request": _request_key(method, self.__redact_path(url), kwargs, self.secret_fields),
+                    "response": {
+                        "status_code": response.status_code,
+                        "headers": {k: v for k, v in response.headers.items() if k.lower() not in _SECRET_HEADERS},
+                        "body": body,
+                    },
+                }
+            )
+        return response
+
+    def save(self) -> None:
+        with self.__lock, open(self.cassette_path, "w") as file:
+            json.dump(self.__interactions, file, indent=1)
+
+    def __collect(self, value: Any) -> None:
+        if isinstance(value, Mapping):
+            for k, v in value.items():
+                if k in self.secret_fields and isinstance(v, (str, int, float)) and not isinstance(v, bool):
+                    self.__placeholders[str(v)] = str(_placeholder(v))
+                else:
+                    self.__collect(v)
+        elif isinstance(value, (list, tuple)):
+            for v in value:
+                self.__collect(v)
+
+    def __redact_path(self, url: str) -> str:
+        path, separator, session = url.partition(";")
+        scheme, _, rest = path.partition("://")
+        segments = [self.__placeholders.get(segment, segment) for segment in rest.split("/")]
+        return scheme + "://" + "/".join(segments) + separator + session
+
+
+class ReplayTransport(Transport):
+    """Replays the interactions of a cassette instead of sending requests, so the client runs fully offline.
+
+    Requests are matched on their method, url and arguments, identical requests get their recorded responses in order.
+    The values of the `secret_fields` are ignored when matching, they must be the fields the cassette was recorded with.
+    """
+
+    def __init__(
+        self,
+        cassette_path: Optional[str] = None,
+        interactions: Optional[List[Mapping]] = None,
+        secret_fields: Optional[Iterable[str]] = None,
+    ):
+        self.secret_fields = frozenset(SECRET_FIELDS if secret_fields is None else secret_fields)
+        if interactions is None:
+            with open(cassette_path) as file:  # type: ignore
+                interactions = json.load(file)
+        self.__lock = threading.Lock()
+        self.__responses: Dict[str, Deque[RecordedResponse]] = defaultdict(deque)
+        for interaction in interactions:
+            recorded = interaction["response"]
+            self.__responses[json.dumps(interaction["request"], sort_keys=True)].append(
+                RecordedResponse(recorded["status_code"], recorded["body"].encode("utf-8"), recorded.get("headers"))
+            )
+
+    def send(self, method: str, url: str, **kwargs: Any) -> Any:
+        key = json.dumps(_request_key(method, url, kwargs, self.secret_fields), sort_keys=True)
+        with self.__lock:
+            responses = self.__responses.get(key)
+            if not responses:
+                raise LookupError(f"No recorded response for {method} {url.split(';')[0]}")
+            # The last response of a request is replayed again when it is asked for more often than it was recorded.
+            return responses.popleft() if len(responses) > 1 else responses[0]
+
+
+def _request_key(
+    method: str, url: str, kwargs: Mapping[str, Any], secret_fields: AbstractSet[str] = SECRET_FIELDS
+) -> Dict[str, Any]:
+    key: Dict[str, Any] = {"method": method, "url": url.split(";")[0]}
+    for name in ("params", "json", "data", "cookies"):
+        value = _load(kwargs.get(name))
+        if value is not None:
+            key[name] = _redact(value, secret_fields)
+    return key
+
+
+def _load(value: Any) -> Any:
+    """Load a request body that was sent as a JSON string."""
+    if isinstance(value, (str, bytes)):
+        try:
+            return json.loads(value)
+        except ValueError:
+            return value if isinstance(value, str) else value.decode("utf-8", errors="replace")
+    return value
+
+
+def _redact(value: Any, secret_fields: AbstractSet[str]) -> Any:
+    if isinstance(value, Mapping):
+        return {k: None if k in secret_fields else _redact(v, secret_fields) for k, v in value.items() if v is not None}
+    if isinstance(value, (list, tuple)):
+        return [_redact(v, secret_fields) for v in value]
+    return value
+
+
+def _placeholders(value: Any, secret_fields: AbstractSet[str]) -> Any:
+    """Replace the values of the secret fields by placeholders of the same type, so that the client still runs."""
+    if isinstance(value, Mapping):
+        return {k: _placeholder(v) if k in secret_fields else _placeholders(v, secret_fields) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_placeholders(v, secret_fields) for v in value]
+    return value
+
+
+def _placeholder(value: Any) -> Any:
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, str):
+        return "REDACTED"
+    if isinstance(value, (int, float)):
+        return 0
+    return None
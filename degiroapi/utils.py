@@ -1,6 +1,44 @@
+import datetime
 import json
-from typing import Dict, List, Union
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Tuple, Union
 
 
 def pretty_json(data: Union[str, int, List, Dict]) -> str:
     return json.dumps(data, indent=4, sort_keys=True)
+
+
+def split_date_range(
+    from_date: datetime.datetime, to_date: datetime.datetime, max_days: int
+) -> List[Tuple[datetime.datetime, datetime.datetime]]:
+    """Split an inclusive range of days into consecutive windows of which the days differ at most `max_days`."""
+    windows = []
+    start = from_date
+    while True:
+        end = min(start + datetime.timedelta(days=max_days), to_date)
+        windows.append((start, end))
+        if end.date() >= to_date.date():
+            return windows
+        start = end + datetime.timedelta(days=1)
+
+
+def field_of(record: Any, name: str) -> Any:
+    """Get a field of a record, which is either a mapping or a typed structure with a plain or snake_case attribute."""
+    if isinstance(record, Mapping):
+        return record.get(name)
+    if hasattr(record, name):
+        return getattr(record, name)
+    return getattr(record, re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower(), None)
+
+
+def iter_unique(pages: Iterable[Iterable[Any]], key: str) -> Iterator[Any]:
+    """Yield the records of all pages, skipping those with a `key` that was seen before."""
+    seen = set()
+    for page in pages:
+        for record in page:
+            record_id: Any = field_of(record, key)
+            if record_id is not None:
+                if record_id in seen:
+                    continue
+                seen.add(record_id)
+            yield record
@@ -46,15 +46,20 @@ print(Product(products[2]).id)
 info = degiro.product_info(5322419)
 print(info["id"], info["name"], info["currency"], info["closePrice"])
 
+# printing info for many product IDs, requested in chunks
+infos = degiro.products_info([331823, 5322419])
+for product_id, info in infos.items():
+    print(product_id, info["name"], info["currency"], info["closePrice"])
+
 # print transactions
 transactions = degiro.transactions(datetime(2019, 1, 1), datetime.now())
 print(pretty_json(transactions))
 
-# print order history (maximum timespan 90 days)
+# print order history (longer timespans are fetched in windows of 90 days)
 orders = degiro.orders(datetime.now() - timedelta(days=90), datetime.now())
 print(pretty_json(orders))
 
-# printing order history (maximum timespan 90 days), with argument True return only open orders
+# printing order history, with argument True return only open orders
 orders = degiro.orders(datetime.now() - timedelta(days=90), datetime.now(), True)
 print(pretty_json(orders))
 
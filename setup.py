@@ -6,8 +6,12 @@ with open("README.md", "r") as fh:
 EXTRA_REQUIRES = {
     "lint": ["black==21.6b0", "flake8==3.9.2", "isort==5.9.3"],
     "mypy": ["mypy==0.910", "mypy-extensions==0.4.3", "typing-extensions==3.10.0.0"],
-    "test": ["pytest==6.2.4", "pytest-cov==2.12.1"],
+    "test": ["pytest==6.2.4", "pytest-cov==2.12.1", "pytest-benchmark==3.4.1"],
     "prec": ["pre-commit==2.13.0", "pydocstyle==5.1.1"],
+    "numpy": ["numpy>=1.17"],
+    "pandas": ["numpy>=1.17", "pandas>=1.0"],
+    "orjson": ["orjson>=3.0"],
+    "msgspec": ["msgspec>=0.9"],
 }
 EXTRA_REQUIRES["devel"] = (
     EXTRA_REQUIRES["lint"] + EXTRA_REQUIRES["mypy"] + EXTRA_REQUIRES["test"] + EXTRA_REQUIRES["prec"]
@@ -31,5 +35,5 @@ setuptools.setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.7",
 )
@@ -0,0 +1,64 @@
+import asyncio
+import datetime
+import json
+import threading
+from typing import Any, List
+
+from degiroapi.async_degiro import AsyncDeGiro
+from degiroapi.client_info import ClientInfo
+from degiroapi.data_type import DataType
+from degiroapi.transport import RecordedResponse, Transport
+
+
+class CountingTransport(Transport):
+    """Answers updates and transactions, remembering the urls it was sent."""
+
+    def __init__(self) -> None:
+        self.urls: List[str] = []
+        self.__lock = threading.Lock()
+
+    def send(self, method: str, url: str, **kwargs: Any) -> Any:
+        with self.__lock:
+            self.urls.append(url)
+        if "/transactions" in url:
+            body: Any = {"data": [{"id": kwargs["params"]["fromDate"]}, {"id": kwargs["params"]["toDate"]}]}
+        else:
+            body = {"portfolio": {"value": []}}
+        return RecordedResponse(200, json.dumps(body).encode())
+
+    def count(self, fragment: str) -> int:
+        return sum(fragment in url for url in self.urls)
+
+
+def client(transport: Transport) -> AsyncDeGiro:
+    degiro = AsyncDeGiro(max_concurrency=4, transport=transport)
+    degiro.client.session_id = "session"
+    degiro.client.client_info = ClientInfo({"intAccount": 1})
+    return degiro
+
+
+def test_identical_gathered_calls_share_one_request() -> None:
+    transport = CountingTransport()
+
+    async def main() -> List[Any]:
+        async with client(transport) as degiro:
+            return await asyncio.gather(*(degiro.get_update({DataType.PORTFOLIO: 0}) for _ in range(10)))
+
+    results = asyncio.run(main())
+
+    assert transport.count("/update/") == 1
+    assert all(result == {"portfolio": {"value": []}} for result in results)
+
+
+def test_iterator_left_early_fetches_no_further_windows() -> None:
+    transport = CountingTransport()
+
+    async def main() -> Any:
+        async with client(transport) as degiro:
+            async for transaction in degiro.iter_transactions(
+                datetime.datetime(2020, 1, 1), datetime.datetime(2026, 1, 1)
+            ):
+                return transaction
+
+    assert asyncio.run(main()) == {"id": "01/01/2020"}
+    assert transport.count("/transactions") == 1
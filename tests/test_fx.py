@@ -0,0 +1,78 @@
+from typing import Any, Iterable, List, Mapping
+
+import pytest
+
+import degiroapi.fx
+from degiroapi.fx import _cross_rates, ExchangeRates
+
+PAIRS = {"EUR/USD": "1", "EUR/GBP": "2", "EUR/CHF": "3"}
+
+
+class FakeDeGiro:
+    """Answers the last price of each pair, counting the fetches."""
+
+    def __init__(self, prices: Mapping[str, float]):
+        self.prices = prices
+        self.fetches = 0
+
+    def combined_real_time_prices(self, product_ids: Iterable[str], interval: str) -> Mapping[str, List[Mapping]]:
+        self.fetches += 1
+        return {product_id: [{"data": {"lastPrice": self.prices[product_id]}}] for product_id in product_ids}
+
+
+def exchange_rates(degiro: Any = None, clock: Any = lambda: 0.0) -> ExchangeRates:
+    degiro = degiro or FakeDeGiro({"1": 1.10, "2": 0.85, "3": 0.95})
+    return ExchangeRates(degiro, PAIRS, ttl=60, clock=clock)
+
+
+def test_inverse_and_cross_rates_are_derived() -> None:
+    rates = exchange_rates()
+
+    assert rates.rate("USD", "EUR") == pytest.approx(1 / 1.10)
+    assert rates.rate("GBP", "CHF") == pytest.approx(0.95 / 0.85)
+    assert rates.rate("CHF", "CHF") == 1.0
+    with pytest.raises(KeyError):
+        rates.rate("EUR", "JPY")
+
+
+def test_direct_pairs_are_preferred_over_chains() -> None:
+    # Through EUR one GBP would be 1.2 USD, the direct pair says 1.3.
+    rates = _cross_rates({("EUR", "USD"): 1.2, ("EUR", "GBP"): 1.0, ("GBP", "USD"): 1.3})
+
+    assert rates[("GBP", "USD")] == pytest.approx(1.3)
+    assert rates[("USD", "GBP")] == pytest.approx(1 / 1.3)
+
+
+def test_rates_are_fetched_again_once_older_than_the_ttl() -> None:
+    now = [0.0]
+    degiro = FakeDeGiro({"1": 1.10, "2": 0.85, "3": 0.95})
+    rates = exchange_rates(degiro, lambda: now[0])
+
+    rates.rate("EUR", "USD")
+    now[0] = 60.0
+    rates.rate("EUR", "USD")
+    assert degiro.fetches == 1
+
+    now[0] = 60.5
+    rates.rate("EUR", "USD")
+    assert degiro.fetches == 2
+
+
+def test_convert_with_numpy() -> None:
+    numpy = pytest.importorskip("numpy")
+    rates = exchange_rates()
+
+    converted = rates.convert([1.0, 2.0, 3.0], ["USD", "EUR", "GBP"], "EUR")
+
+    assert isinstance(converted, numpy.ndarray)
+    assert converted.tolist() == pytest.approx([1 / 1.10, 2.0, 3 / 0.85])
+    assert rates.convert([1.0, 2.0], "GBP", "EUR").tolist() == pytest.approx([1 / 0.85, 2 / 0.85])
+
+
+def test_convert_without_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(degiroapi.fx, "numpy", None)
+    rates = exchange_rates()
+
+    assert rates.convert([1.0, 2.0, 3.0], ["USD", "EUR", "GBP"], "EUR") == pytest.approx([1 / 1.10, 2.0, 3 / 0.85])
+    assert rates.convert([1.0, 2.0], "GBP", "EUR") == pytest.approx([1 / 0.85, 2 / 0.85])
+    assert rates.convert(10, "EUR", "USD") == pytest.approx(11.0)
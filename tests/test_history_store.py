@@ -0,0 +1,48 @@
+import datetime
+from typing import Any, List, Mapping
+
+from degiroapi.history_store import HistoryStore
+
+DEPOSIT = {"date": "2026-03-02T10:00:00+01:00", "type": "CASH_TRANSACTION", "change": 100.0, "currency": "EUR"}
+
+
+class FakeDeGiro:
+    """Answers with the given cash movements and no transactions, remembering the windows it was asked for."""
+
+    def __init__(self, cash_movements: List[Mapping]):
+        self.cash_movements = cash_movements
+        self.windows: List[Any] = []
+
+    def transactions(self, from_date: datetime.datetime, to_date: datetime.datetime) -> List[Mapping]:
+        return []
+
+    def account_overview(self, from_date: datetime.datetime, to_date: datetime.datetime) -> Mapping:
+        self.windows.append((from_date, to_date))
+        return {
+            "cashMovements": [
+                movement for movement in self.cash_movements if movement["date"][:10] >= f"{from_date:%Y-%m-%d}"
+            ]
+        }
+
+
+def test_identical_movements_without_an_id_are_all_stored() -> None:
+    store = HistoryStore()
+    degiro = FakeDeGiro([DEPOSIT, dict(DEPOSIT)])
+
+    store.sync(degiro, datetime.datetime(2026, 1, 1), datetime.datetime(2026, 3, 31))  # type: ignore
+
+    assert store.cash_movements() == [DEPOSIT, DEPOSIT]
+
+
+def test_refetched_last_day_is_not_stored_twice() -> None:
+    store = HistoryStore()
+    earlier = {"date": "2026-02-27T09:00:00+01:00", "type": "DEPOSIT", "change": 50.0, "currency": "EUR"}
+    degiro = FakeDeGiro([earlier, DEPOSIT, dict(DEPOSIT)])
+    store.sync(degiro, datetime.datetime(2026, 1, 1), datetime.datetime(2026, 3, 2))  # type: ignore
+
+    later = dict(DEPOSIT, change=25.0)
+    degiro.cash_movements.append(later)
+    store.sync(degiro, datetime.datetime(2026, 1, 1), datetime.datetime(2026, 3, 31))  # type: ignore
+
+    assert degiro.windows[-1][0] == datetime.datetime(2026, 3, 2)
+    assert store.cash_movements() == [earlier, DEPOSIT, DEPOSIT, later]
@@ -0,0 +1,43 @@
+from typing import Any, Iterable, List, Mapping
+
+from degiroapi.order_batch import OrderResult, OrderSpec
+from degiroapi.order_book import OrderBook
+from degiroapi.order_type import OrderType
+
+
+class FakeDeGiro:
+    """Places orders without telling their order id, and answers polls with the queued updates."""
+
+    def __init__(self) -> None:
+        self.updates: List[Mapping] = []
+
+    def place_orders(self, orders: Iterable[OrderSpec], max_workers: int) -> List[OrderResult]:
+        return [OrderResult(order, "confirmation", None, None, None, 0.0, 0.0) for order in orders]
+
+    def get_update(self, last_updated: Mapping[str, int]) -> Mapping:
+        return self.updates.pop(0)
+
+
+def orders_update(*orders: Mapping[str, Any], last_updated: int = 1) -> Mapping:
+    value = [
+        {"id": order["id"], "value": [{"name": name, "value": value} for name, value in order.items()]}
+        for order in orders
+    ]
+    return {"orders": {"lastUpdated": last_updated, "value": value}}
+
+
+def test_order_placed_without_an_order_id_is_replaced_by_the_polled_order() -> None:
+    degiro = FakeDeGiro()
+    book = OrderBook(degiro)  # type: ignore
+    degiro.updates = [
+        orders_update({"id": "other", "productId": 331823, "buysell": "S", "size": 5}),
+        orders_update({"id": "order", "productId": 331823, "buysell": "B", "size": 5}, last_updated=2),
+    ]
+    book.poll()
+
+    book.place_orders([OrderSpec("BUY", OrderType.LIMIT, "331823", 1, 5, 10)])
+    assert sorted(order["id"] for order in book.open_orders("331823")) == ["confirmation", "other"]
+
+    book.poll()
+    assert sorted(order["id"] for order in book.open_orders("331823")) == ["order", "other"]
+    assert book.get("confirmation") is None
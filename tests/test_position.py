@@ -0,0 +1,58 @@
+from typing import Any, Mapping
+
+from degiroapi.portfolio_stream import PortfolioStream
+from degiroapi.position import parse_position_dicts, parse_positions, Position
+
+
+def row(position_id: str, **cells: Any) -> Mapping:
+    return {"id": position_id, "value": [{"name": name, "value": value} for name, value in cells.items()]}
+
+
+PORTFOLIO = {
+    "portfolio": {
+        "value": [
+            row("1", positionType="PRODUCT", size=10.0, price=2.5, value=25.0, breakEvenPrice=2.0, plBase={}),
+            row("2", positionType="PRODUCT", size=0.0, price=1.0, value=0.0),
+            row("FLATEX_EUR", positionType="CASH", size=100.0),
+        ]
+    }
+}
+
+
+def test_dicts_are_the_positions_as_dicts() -> None:
+    for filter_zero in (False, True):
+        positions = parse_positions(PORTFOLIO, filter_zero)
+        assert parse_position_dicts(PORTFOLIO, filter_zero) == [position.to_dict() for position in positions]
+
+
+def test_empty_positions_are_filtered() -> None:
+    assert [position.id for position in parse_positions(PORTFOLIO, filter_zero=True)] == ["1", "FLATEX_EUR"]
+    assert parse_positions(PORTFOLIO)[0] == Position("1", "PRODUCT", 10.0, 2.5, 25.0, 2.0)
+    assert parse_positions(PORTFOLIO)[1].empty
+
+
+class FakeDeGiro:
+    """Answers with the queued portfolio sections."""
+
+    def __init__(self, *portfolios: Mapping):
+        self.portfolios = list(portfolios)
+
+    def get_update(self, last_updated: Mapping) -> Mapping:
+        return {"portfolio": self.portfolios.pop(0)}
+
+
+def test_stream_applies_the_changed_cells_to_the_previous_position() -> None:
+    degiro = FakeDeGiro(
+        dict(PORTFOLIO["portfolio"], lastUpdated=1),
+        {"lastUpdated": 2, "value": [row("1", price=3.0), {"id": "FLATEX_EUR", "isRemoved": True}]},
+    )
+    stream = PortfolioStream(degiro)  # type: ignore
+
+    stream.poll()
+    changed = stream.poll()
+
+    assert changed == [
+        {"id": "1", "positionType": "PRODUCT", "size": 10.0, "price": 3.0, "value": 25.0, "breakEvenPrice": 2.0},
+        {"id": "FLATEX_EUR", "isRemoved": True},
+    ]
+    assert stream.positions(filter_zero=True) == changed[:1]
@@ -0,0 +1,68 @@
+import json
+from typing import Any, List
+
+from degiroapi.client_info import ClientInfo
+from degiroapi.degiro import DeGiro
+from degiroapi.interval_type import IntervalType
+from degiroapi.product_cache import ProductCache
+from degiroapi.transport import RecordedResponse, Transport
+
+
+class ProductServer(Transport):
+    """Answers product info and chart requests, remembering the urls it was sent."""
+
+    def __init__(self) -> None:
+        self.urls: List[str] = []
+
+    def send(self, method: str, url: str, **kwargs: Any) -> Any:
+        self.urls.append(url)
+        if "products/info" in url:
+            ids = json.loads(kwargs["data"])
+            body: Any = {
+                "data": {i: {"id": i, "closePrice": 1.0, "vwdIdentifierType": "issueid", "vwdId": i} for i in ids}
+            }
+        else:
+            body = {"series": [{"type": "time", "data": [[0, 1.0]]}]}
+        return RecordedResponse(200, json.dumps(body).encode())
+
+    def count(self, fragment: str) -> int:
+        return sum(fragment in url for url in self.urls)
+
+
+def client(product_cache: ProductCache = None) -> DeGiro:
+    degiro = DeGiro(product_cache=product_cache, transport=ProductServer())
+    degiro.session_id = "session"
+    degiro.client_info = ClientInfo({"intAccount": 1})
+    return degiro
+
+
+def test_product_info_is_fetched_on_every_call_by_default() -> None:
+    degiro = client()
+
+    degiro.product_info(331823)
+    degiro.product_info(331823)
+
+    assert degiro.transport.count("products/info") == 2  # type: ignore
+
+
+def test_vwd_identifiers_are_cached_by_default() -> None:
+    degiro = client()
+
+    degiro.real_time_price(331823, IntervalType.One_Day)
+    degiro.real_time_price(331823, IntervalType.One_Day)
+
+    assert degiro.transport.count("products/info") == 1  # type: ignore
+    assert degiro.transport.count("charting") == 2  # type: ignore
+
+
+def test_cached_product_info_cannot_be_changed_by_callers() -> None:
+    clock = [0.0]
+    degiro = client(ProductCache(ttl=60, clock=lambda: clock[0]))
+
+    degiro.product_info(331823)["closePrice"] = 2.0  # type: ignore
+    assert degiro.product_info(331823)["closePrice"] == 1.0
+    assert degiro.transport.count("products/info") == 1  # type: ignore
+
+    clock[0] = 61.0
+    degiro.product_info(331823)
+    assert degiro.transport.count("products/info") == 2  # type: ignore
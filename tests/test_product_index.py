@@ -0,0 +1,12 @@
+from degiroapi.product_index import ProductIndex
+
+
+def test_products_missing_optional_fields_are_indexed_on_the_fields_they_have() -> None:
+    index = ProductIndex()
+    index.add([{"id": "5", "name": "Fund"}, {"id": "6", "isin": "US0000000006", "symbol": "abc"}])
+
+    assert "5" in index and "6" in index
+    assert [product.id for product in index.by_name_prefix("fu")] == ["5"]
+    assert [product.id for product in index.by_isin("US0000000006")] == ["6"]
+    assert [product.id for product in index.by_symbol("ABC")] == ["6"]
+    assert [product.id for product in index.fuzzy_search("fund")] == ["5"]
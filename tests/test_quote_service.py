@@ -0,0 +1,42 @@
+import asyncio
+import logging
+from typing import Any, Iterable, Mapping
+
+import pytest
+
+from degiroapi.quote_service import QuoteService
+
+
+class FakeDeGiro:
+    """Answers every product with the same series."""
+
+    def combined_real_time_prices(self, product_ids: Iterable[str], interval: Any, batch_size: int) -> Mapping:
+        return {product_id: [{"type": "time", "data": [[0, 1.5]]}] for product_id in product_ids}
+
+
+def test_failing_callback_is_logged(caplog: pytest.LogCaptureFixture) -> None:
+    quotes = QuoteService(FakeDeGiro())  # type: ignore
+    quotes.subscribe("331823", lambda result: 1 / 0)
+
+    with caplog.at_level(logging.ERROR, logger="degiroapi.quote_service"):
+        quotes.poll()
+
+    assert "331823" in caplog.text and "ZeroDivisionError" in caplog.text
+
+
+def test_queue_subscribed_from_a_coroutine_gets_the_quotes_on_the_running_loop() -> None:
+    async def main() -> Any:
+        quotes = QuoteService(FakeDeGiro())  # type: ignore
+        queue: asyncio.Queue = asyncio.Queue()
+        quotes.subscribe_queue("331823", queue)
+        await asyncio.get_running_loop().run_in_executor(None, quotes.poll)
+        return await asyncio.wait_for(queue.get(), 1)
+
+    assert asyncio.run(main()).product_id == "331823"
+
+
+def test_queue_without_a_loop_outside_of_a_coroutine_is_refused() -> None:
+    quotes = QuoteService(FakeDeGiro())  # type: ignore
+
+    with pytest.raises(RuntimeError):
+        quotes.subscribe_queue("331823", asyncio.Queue())
@@ -0,0 +1,22 @@
+import pickle
+
+import pytest
+
+from degiroapi.product import Product
+
+
+def test_raw_mapping_is_read_only() -> None:
+    product = Product({"id": "331823", "vwdId": "350015372"})
+
+    with pytest.raises(TypeError):
+        product.raw["id"] = "1"  # type: ignore
+    with pytest.raises(AttributeError):
+        product.id = "1"  # type: ignore
+    assert product.vwd_id == "350015372"
+
+
+def test_records_pickle_and_compare_by_their_fields() -> None:
+    product = Product({"id": "331823", "name": "Apple"})
+
+    assert pickle.loads(pickle.dumps(product)) == product
+    assert product.raw == {"id": "331823", "name": "Apple"}
@@ -0,0 +1,310 @@
+import json
+import time
+from typing import Any, Callable, List, Mapping, Optional, Tuple
+
+import pytest
+import requests
+
+import degiroapi.degiro
+from degiroapi.client_info import ClientInfo
+from degiroapi.degiro import DeGiro
+from degiroapi.exceptions import (
+    DeGiroConnectionError,
+    DeGiroRateLimited,
+    DeGiroRequestError,
+    DeGiroServerError,
+    DeGiroSessionExpired,
+)
+from degiroapi.order_batch import OrderSpec
+from degiroapi.order_type import OrderType
+from degiroapi.retry_policy import RetryPolicy
+from degiroapi.transport import RecordedResponse, Transport
+
+Handler = Callable[[str, str, Mapping[str, Any]], RecordedResponse]
+
+
+class FakeTransport(Transport):
+    """Answers the requests of a client with a handler, like a local fake DeGiro server."""
+
+    def __init__(self, handler: Handler):
+        self.handler = handler
+        self.calls: List[Tuple[str, str, Mapping[str, Any]]] = []
+
+    def send(self, method: str, url: str, **kwargs: Any) -> Any:
+        self.calls.append((method, url, kwargs))
+        return self.handler(method, url, kwargs)
+
+    def count(self, fragment: str) -> int:
+        return sum(fragment in url for _, url, _ in self.calls)
+
+
+def respond(body: Any, status_code: int = 200, headers: Optional[Mapping[str, str]] = None) -> RecordedResponse:
+    return RecordedResponse(status_code, json.dumps(body).encode(), headers)
+
+
+class FakeDeGiro:
+    """A fake DeGiro server that hands out a new session id on every login."""
+
+    def __init__(self) -> None:
+        self.logins = 0
+        self.valid_session: Optional[str] = None
+        self.answers: List[RecordedResponse] = []
+
+    def __call__(self, method: str, url: str, kwargs: Mapping[str, Any]) -> RecordedResponse:
+        if "login/secure/login" in url:
+            self.logins += 1
+            self.valid_session = f"session-{self.logins}"
+            return respond({"sessionId": self.valid_session})
+        if "pa/secure/client" in url:
+            return respond({"data": {"intAccount": 1, "username": "user"}})
+        if "login/secure/config" in url:
+            return respond({"data": {"clientId": "token"}})
+        session_id = url.split(";jsessionid=")[1] if ";jsessionid=" in url else kwargs["params"].get("sessionId")
+        if self.valid_session is None or session_id != self.valid_session:
+            return respond({"errors": "session expired"}, 401)
+        if self.answers:
+            return self.answers.pop(0)
+        return respond({"data": {"confirmationId": "confirmation", "orderId": "order"}})
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> List[float]:
+    delays: List[float] = []
+    monkeypatch.setattr(degiroapi.degiro.time, "sleep", delays.append)
+    return delays
+
+
+@pytest.fixture
+def server() -> FakeDeGiro:
+    return FakeDeGiro()
+
+
+@pytest.fixture
+def degiro(server: FakeDeGiro) -> DeGiro:
+    client = DeGiro(transport=FakeTransport(server))
+    client.login("user", "password")
+    return client
+
+
+def test_expired_session_logs_in_again_and_replays_with_the_new_session(degiro: DeGiro, server: FakeDeGiro) -> None:
+    server.valid_session = "renewed-elsewhere"
+
+    assert degiro.get_update({"portfolio": 0}) == {"data": {"confirmationId": "confirmation", "orderId": "order"}}
+
+    method, url, kwargs = degiro.transport.calls[-1]  # type: ignore
+    assert server.logins == 2
+    assert degiro.session_id == "session-2"
+    assert url.endswith(";jsessionid=session-2")
+
+
+def test_expired_session_is_replaced_in_the_request_parameters(degiro: DeGiro, server: FakeDeGiro) -> None:
+    server.answers = [respond({"data": [{"id": 1}]})]
+    server.valid_session = "renewed-elsewhere"
+
+    assert degiro.future_dividends() == [{"id": 1}]
+    method, url, kwargs = degiro.transport.calls[-1]  # type: ignore
+    assert kwargs["params"]["sessionId"] == "session-2"
+
+
+def test_session_expired_twice_raises_after_one_login(degiro: DeGiro, server: FakeDeGiro) -> None:
+    server.answers = [respond({}, 401)]
+    server.valid_session = "renewed-elsewhere"
+
+    with pytest.raises(DeGiroSessionExpired):
+        degiro.get_update({"portfolio": 0})
+    assert server.logins == 2
+
+
+def test_expired_session_without_credentials_is_not_replayed(server: FakeDeGiro) -> None:
+    degiro = DeGiro(transport=FakeTransport(server))
+    degiro.session_id = "unknown"
+    degiro.client_info = ClientInfo({"intAccount": 1})
+
+    with pytest.raises(DeGiroSessionExpired):
+        degiro.get_update({"portfolio": 0})
+    assert server.logins == 0
+
+
+def test_logout_of_an_expired_session_does_not_log_in_again(degiro: DeGiro, server: FakeDeGiro) -> None:
+    server.valid_session = "renewed-elsewhere"
+    degiro.transport.calls.clear()  # type: ignore
+
+    degiro.logout()
+
+    assert server.logins == 1
+    assert [url.split(";")[0].rsplit("/", 1)[1] for _, url, _ in degiro.transport.calls] == ["logout"]  # type: ignore
+
+
+def test_retry_after_is_honoured(degiro: DeGiro, server: FakeDeGiro, sleeps: List[float]) -> None:
+    server.answers = [respond({}, 429, {"Retry-After": "7"}), respond({"ok": True})]
+
+    assert degiro.get_update({"portfolio": 0}) == {"ok": True}
+    assert len(sleeps) == 1 and sleeps[0] >= 7
+
+
+def test_retry_after_is_capped_by_the_policy(degiro: DeGiro, server: FakeDeGiro, sleeps: List[float]) -> None:
+    degiro.retry_policies["update"] = RetryPolicy(backoff_max=2.0)
+    server.answers = [respond({}, 503, {"Retry-After": "600"}), respond({"ok": True})]
+
+    assert degiro.get_update({"portfolio": 0}) == {"ok": True}
+    assert sleeps == [2.0]
+
+
+def test_server_errors_are_retried_until_the_budget_is_spent(
+    degiro: DeGiro, server: FakeDeGiro, sleeps: List[float]
+) -> None:
+    degiro.retry_policies["update"] = RetryPolicy(max_retries=2)
+    server.answers = [respond({}, 502) for _ in range(5)]
+
+    with pytest.raises(DeGiroServerError) as error:
+        degiro.get_update({"portfolio": 0})
+    assert error.value.status_code == 502
+    assert degiro.transport.count("/update/") == 3  # type: ignore
+    assert len(sleeps) == 2
+
+
+def test_connection_errors_of_reads_are_retried(degiro: DeGiro, server: FakeDeGiro, sleeps: List[float]) -> None:
+    failures = [requests.ConnectionError("reset")]
+
+    def handler(method: str, url: str, kwargs: Mapping[str, Any]) -> RecordedResponse:
+        if failures:
+            raise failures.pop()
+        return server(method, url, kwargs)
+
+    degiro.transport = FakeTransport(handler)
+    assert degiro.get_update({"portfolio": 0})
+    assert len(degiro.transport.calls) == 2
+    assert len(sleeps) == 1
+
+
+@pytest.mark.parametrize("status_code", [500, 502, 503, 504])
+def test_order_confirmation_is_not_replayed_on_server_errors(
+    degiro: DeGiro, server: FakeDeGiro, sleeps: List[float], status_code: int
+) -> None:
+    server.answers = [respond({"data": {"confirmationId": "confirmation"}}), respond({}, status_code)]
+
+    with pytest.raises(DeGiroServerError):
+        degiro.buy_order(OrderType.LIMIT, "331823", 1, 1, 10)
+    assert degiro.transport.count("/order/confirmation") == 1  # type: ignore
+    assert sleeps == []
+
+
+def test_order_confirmation_is_not_replayed_on_connection_errors(degiro: DeGiro, server: FakeDeGiro) -> None:
+    def handler(method: str, url: str, kwargs: Mapping[str, Any]) -> RecordedResponse:
+        if "/order/confirmation" in url:
+            raise requests.ConnectionError("reset")
+        return server(method, url, kwargs)
+
+    degiro.transport = FakeTransport(handler)
+    with pytest.raises(DeGiroConnectionError):
+        degiro.buy_order(OrderType.LIMIT, "331823", 1, 1, 10)
+    assert degiro.transport.count("/order/confirmation") == 1
+
+
+def test_order_confirmation_is_retried_when_throttled(degiro: DeGiro, server: FakeDeGiro, sleeps: List[float]) -> None:
+    server.answers = [
+        respond({"data": {"confirmationId": "confirmation"}}),
+        respond({}, 429),
+        respond({"data": {"orderId": "order"}}),
+    ]
+
+    assert degiro.buy_order(OrderType.LIMIT, "331823", 1, 1, 10) == "confirmation"
+    assert degiro.transport.count("/order/confirmation") == 2  # type: ignore
+
+
+def test_order_confirmation_gives_up_when_throttled_too_long(
+    degiro: DeGiro, server: FakeDeGiro, sleeps: List[float]
+) -> None:
+    server.answers = [respond({"data": {"confirmationId": "confirmation"}})] + [respond({}, 429) for _ in range(9)]
+
+    with pytest.raises(DeGiroRateLimited):
+        degiro.buy_order(OrderType.LIMIT, "331823", 1, 1, 10)
+    max_retries = degiro.retry_policies["confirm_order"].max_retries
+    assert degiro.transport.count("/order/confirmation") == max_retries + 1  # type: ignore
+
+
+def test_order_confirmation_rejected_for_an_expired_session_is_sent_again_in_a_new_session(
+    degiro: DeGiro, server: FakeDeGiro
+) -> None:
+    server.answers = [respond({"data": {"confirmationId": "confirmation"}})]
+
+    def handler(method: str, url: str, kwargs: Mapping[str, Any]) -> RecordedResponse:
+        if "/order/confirmation" in url and server.logins == 1:
+            server.valid_session = "expired"
+        return server(method, url, kwargs)
+
+    degiro.transport = FakeTransport(handler)
+    degiro.buy_order(OrderType.LIMIT, "331823", 1, 1, 10)
+    confirmations = [url for _, url, _ in degiro.transport.calls if "/order/confirmation" in url]
+    assert server.logins == 2
+    assert [url.split(";")[1] for url in confirmations] == ["jsessionid=session-1", "jsessionid=session-2"]
+
+
+def order_desk(server: FakeDeGiro) -> Handler:
+    """Checks and confirms orders by product id: "bad-check" fails its check and "bad-confirm" its confirmation.
+
+    The order for product "slow" takes longest, so that its results come in last.
+    """
+
+    def handler(method: str, url: str, kwargs: Mapping[str, Any]) -> RecordedResponse:
+        if "/checkOrder" not in url and "/order/" not in url:
+            return server(method, url, kwargs)
+        product_id = kwargs["json"]["productId"]
+        if product_id == "slow":
+            time.sleep(0.05)
+        if "/checkOrder" in url:
+            if product_id == "bad-check":
+                return respond({"errors": [{"text": "Not enough funds"}]}, 400)
+            return respond({"data": {"confirmationId": f"confirmation-{product_id}"}})
+        if product_id == "bad-confirm":
+            return respond({"errors": [{"text": "Order rejected"}]}, 400)
+        return respond({"data": {"orderId": f"order-{product_id}"}})
+
+    return handler
+
+
+def test_place_orders_confirms_the_checked_orders_and_reports_the_others(degiro: DeGiro, server: FakeDeGiro) -> None:
+    degiro.transport = FakeTransport(order_desk(server))
+    orders = [
+        OrderSpec("BUY", OrderType.LIMIT, product_id, 1, 1, 10)
+        for product_id in ("slow", "bad-check", "bad-confirm", "ok")
+    ]
+
+    results = degiro.place_orders(orders)
+
+    assert [result.order for result in results] == orders
+    slow, bad_check, bad_confirm, ok = results
+    assert (slow.placed, slow.confirmation_id, slow.order_id) == (True, "confirmation-slow", "order-slow")
+    assert (ok.placed, ok.confirmation_id, ok.order_id) == (True, "confirmation-ok", "order-ok")
+    assert (bad_check.placed, bad_check.stage, bad_check.confirmation_id) == (False, "check", None)
+    assert isinstance(bad_check.error, DeGiroRequestError)
+    assert (bad_confirm.placed, bad_confirm.stage, bad_confirm.confirmation_id) == (
+        False,
+        "confirm",
+        "confirmation-bad-confirm",
+    )
+    assert bad_confirm.order_id is None and bad_confirm.confirm_seconds is not None
+
+
+def test_place_orders_never_confirms_an_order_whose_check_failed(degiro: DeGiro, server: FakeDeGiro) -> None:
+    degiro.transport = FakeTransport(order_desk(server))
+
+    degiro.place_orders([OrderSpec("BUY", OrderType.LIMIT, product_id, 1, 1, 10) for product_id in ("bad-check", "ok")])
+
+    confirmed = [kwargs["json"]["productId"] for _, url, kwargs in degiro.transport.calls if "/order/" in url]
+    assert confirmed == ["ok"]
+
+
+def test_delete_orders_reports_each_order_in_the_given_order(degiro: DeGiro, server: FakeDeGiro) -> None:
+    def handler(method: str, url: str, kwargs: Mapping[str, Any]) -> RecordedResponse:
+        if "/order/missing" in url:
+            return respond({"errors": [{"text": "Order not found"}]}, 404)
+        return server(method, url, kwargs)
+
+    degiro.transport = FakeTransport(handler)
+
+    results = degiro.delete_orders(["order-1", "missing", "order-3"])
+
+    assert [result.order_id for result in results] == ["order-1", "missing", "order-3"]
+    assert [result.deleted for result in results] == [True, False, True]
+    assert isinstance(results[1].error, DeGiroRequestError)
@@ -0,0 +1,171 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List
+
+import pytest
+
+from degiroapi.client_info import ClientInfo
+from degiroapi.data_type import DataType
+from degiroapi.degiro import DeGiro
+from degiroapi.order_type import OrderType
+from degiroapi.single_flight import AsyncSingleFlight, SingleFlight
+from degiroapi.transport import RecordedResponse, Transport
+
+CALLERS = 8
+
+
+def wait_until(condition: Callable[[], bool], timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def run_concurrently(func: Callable[[], Any]) -> List[Any]:
+    """Call `func` from CALLERS threads at once, returning what each returned or raised."""
+
+    def call() -> Any:
+        try:
+            return func()
+        except Exception as exc:
+            return exc
+
+    with ThreadPoolExecutor(CALLERS) as executor:
+        return [future.result() for future in [executor.submit(call) for _ in range(CALLERS)]]
+
+
+def test_identical_concurrent_calls_run_once_and_share_the_result() -> None:
+    flight = SingleFlight()
+    calls = []
+
+    def fetch() -> Any:
+        calls.append(1)
+        wait_until(lambda: flight.merged == CALLERS - 1)
+        return {"data": []}
+
+    results = run_concurrently(lambda: flight.do("key", fetch))
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert flight.stats() == {"in_flight": 0, "calls": 1, "merged": CALLERS - 1}
+
+
+def test_exception_of_a_shared_call_reaches_every_caller() -> None:
+    flight = SingleFlight()
+    error = ValueError("No data was returned.")
+
+    def fetch() -> Any:
+        wait_until(lambda: flight.merged == CALLERS - 1)
+        raise error
+
+    assert run_concurrently(lambda: flight.do("key", fetch)) == [error] * CALLERS
+
+
+def test_calls_after_a_shared_call_finished_run_again() -> None:
+    flight = SingleFlight()
+
+    assert flight.do("key", lambda: 1) == 1
+    assert flight.do("key", lambda: 2) == 2
+
+
+def test_identical_concurrent_coroutines_run_once() -> None:
+    async def main() -> List[Any]:
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def fetch() -> Any:
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"data": []}
+
+        results = await asyncio.gather(*(flight.do("key", fetch) for _ in range(CALLERS)))
+        assert len(calls) == 1
+        return results
+
+    results = asyncio.run(main())
+    assert all(result is results[0] for result in results)
+
+
+def test_exception_of_a_shared_coroutine_reaches_every_caller() -> None:
+    async def main() -> List[Any]:
+        flight = AsyncSingleFlight()
+
+        async def fetch() -> Any:
+            await asyncio.sleep(0.01)
+            raise ValueError("No data was returned.")
+
+        return await asyncio.gather(*(flight.do("key", fetch) for _ in range(CALLERS)), return_exceptions=True)
+
+    errors = asyncio.run(main())
+    assert all(isinstance(error, ValueError) and error is errors[0] for error in errors)
+
+
+def test_cancelled_caller_does_not_cancel_the_shared_coroutine() -> None:
+    async def main() -> Any:
+        flight = AsyncSingleFlight()
+        release = asyncio.Event()
+
+        async def fetch() -> Any:
+            await release.wait()
+            return "result"
+
+        first = asyncio.ensure_future(flight.do("key", fetch))
+        second = asyncio.ensure_future(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(main()) == "result"
+
+
+class CountingTransport(Transport):
+    """Answers every request with the same body, counting the requests to each url."""
+
+    def __init__(self, on_send: Callable[[str], Any] = lambda url: None):
+        self.on_send = on_send
+        self.urls: List[str] = []
+        self.__lock = threading.Lock()
+
+    def send(self, method: str, url: str, **kwargs: Any) -> Any:
+        with self.__lock:
+            self.urls.append(url)
+        self.on_send(url)
+        return RecordedResponse(200, json.dumps({"data": {"confirmationId": "confirmation"}}).encode())
+
+    def count(self, fragment: str) -> int:
+        return sum(fragment in url for url in self.urls)
+
+
+def client(transport: Transport) -> DeGiro:
+    degiro = DeGiro(transport=transport)
+    degiro.session_id = "session"
+    degiro.client_info = ClientInfo({"intAccount": 1})
+    return degiro
+
+
+def test_identical_concurrent_reads_of_the_client_share_one_request() -> None:
+    degiro = client(CountingTransport(lambda url: wait_until(lambda: degiro.single_flight.merged == CALLERS - 1)))
+
+    run_concurrently(lambda: degiro.get_update({DataType.PORTFOLIO: 0}))
+
+    assert degiro.transport.count("/update/") == 1  # type: ignore
+
+
+def test_identical_concurrent_orders_are_never_merged() -> None:
+    # Every request waits for all of them to be in flight, which only works out when none of them was merged.
+    arrived = threading.Barrier(CALLERS, timeout=2)
+    degiro = client(CountingTransport(lambda url: arrived.wait()))
+
+    results = run_concurrently(lambda: degiro.buy_order(OrderType.LIMIT, "331823", 1, 1, 10))
+
+    assert results == ["confirmation"] * CALLERS
+    assert degiro.transport.count("/checkOrder") == CALLERS  # type: ignore
+    assert degiro.transport.count("/order/confirmation") == CALLERS  # type: ignore
+    assert degiro.single_flight.merged == 0
@@ -0,0 +1,82 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from degiroapi.data_type import DataType
+from degiroapi.degiro import DeGiro
+from degiroapi.transport import RecordedResponse, RecordingTransport, ReplayTransport, Transport
+
+SECRETS = ("user@example.com", "s3cret", "session-1", "12345678", "87654321", "Jane", "Doe", "Set-Cookie")
+
+
+class FakeDeGiro(Transport):
+    """Answers like DeGiro, with the secrets a real session would put in a cassette."""
+
+    def send(self, method: str, url: str, **kwargs: Any) -> Any:
+        if "login/secure/login" in url:
+            body: Any = {"sessionId": "session-1"}
+        elif "pa/secure/client" in url:
+            body = {
+                "data": {
+                    "intAccount": 12345678,
+                    "username": "user@example.com",
+                    "email": "user@example.com",
+                    "firstContact": {"firstName": "Jane", "lastName": "Doe"},
+                }
+            }
+        elif "login/secure/config" in url:
+            body = {"data": {"clientId": 87654321}}
+        else:
+            body = {"portfolio": {"value": [{"id": "1", "value": [{"name": "size", "value": 2.0}]}]}}
+        headers = {"Content-Type": "application/json", "Set-Cookie": "JSESSIONID=session-1; Path=/"}
+        return RecordedResponse(200, json.dumps(body).encode(), headers)
+
+
+def record(path: Path) -> None:
+    degiro = DeGiro(transport=RecordingTransport(FakeDeGiro(), str(path)))
+    degiro.login("user@example.com", "s3cret")
+    degiro.get_data(DataType.PORTFOLIO)
+    degiro.transport.save()  # type: ignore
+
+
+def test_cassette_leaves_out_credentials_session_account_and_personal_data(tmp_path: Path) -> None:
+    record(tmp_path / "cassette.json")
+
+    cassette = (tmp_path / "cassette.json").read_text()
+    assert [secret for secret in SECRETS if secret in cassette] == []
+    assert "Content-Type" in cassette
+
+
+def test_redacted_cassette_replays(tmp_path: Path) -> None:
+    record(tmp_path / "cassette.json")
+
+    degiro = DeGiro(transport=ReplayTransport(str(tmp_path / "cassette.json")))
+    degiro.login("someone@example.com", "other")
+
+    assert degiro.client_info.account_id == 0
+    assert degiro.get_data(DataType.PORTFOLIO) == [
+        {"id": "1", "positionType": None, "size": 2.0, "price": None, "value": None, "breakEvenPrice": None}
+    ]
+
+
+def test_secret_fields_are_configurable(tmp_path: Path) -> None:
+    path = tmp_path / "cassette.json"
+    degiro = DeGiro(
+        transport=RecordingTransport(FakeDeGiro(), str(path), secret_fields={"sessionId", "password", "JSESSIONID"})
+    )
+    degiro.login("user@example.com", "s3cret")
+    degiro.transport.save()  # type: ignore
+
+    cassette = path.read_text()
+    assert "s3cret" not in cassette and "session-1" not in cassette
+    assert "user@example.com" in cassette
+
+
+def test_transport_without_send_cannot_be_created() -> None:
+    class Incomplete(Transport):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()  # type: ignore
@@ -0,0 +1,77 @@
+import datetime
+import json
+from typing import Any, Mapping, Union
+
+import pytest
+
+from degiroapi.client_info import ClientInfo
+from degiroapi.degiro import DeGiro
+from degiroapi.transport import RecordedResponse, Transport
+
+pytest.importorskip("msgspec")
+
+import msgspec  # noqa: E402
+
+
+class Transaction(msgspec.Struct):
+    id: int
+    product_id: int = msgspec.field(name="productId")
+    quantity: int
+
+
+class Order(msgspec.Struct):
+    order_id: str = msgspec.field(name="orderId")
+    is_active: bool = msgspec.field(name="isActive")
+
+
+class StubTransport(Transport):
+    """Answers every request with the same body, given as JSON or as raw bytes."""
+
+    def __init__(self, body: Any):
+        self.body = body
+
+    def send(self, method: str, url: str, **kwargs: Any) -> Any:
+        return RecordedResponse(200, self.body if isinstance(self.body, bytes) else json.dumps(self.body).encode())
+
+
+def client(body: Union[Mapping, bytes]) -> DeGiro:
+    degiro = DeGiro(transport=StubTransport(body))
+    degiro.session_id = "session"
+    degiro.client_info = ClientInfo({"intAccount": 1})
+    return degiro
+
+
+def test_transactions_are_decoded_into_the_given_type() -> None:
+    degiro = client({"data": [{"id": 1, "productId": 2, "quantity": 3, "price": 4.5}]})
+
+    transactions = degiro.transactions(datetime.datetime(2026, 1, 1), datetime.datetime(2026, 1, 2), type_=Transaction)
+
+    assert transactions == [Transaction(id=1, product_id=2, quantity=3)]
+
+
+def test_typed_orders_are_deduplicated_and_filtered_by_their_attributes() -> None:
+    degiro = client({"data": [{"orderId": "a", "isActive": True}, {"orderId": "b", "isActive": False}]})
+
+    orders = degiro.orders(datetime.datetime(2025, 1, 1), datetime.datetime(2026, 1, 1), True, type_=Order)
+
+    assert orders == [Order(order_id="a", is_active=True)]
+
+
+def test_stock_list_without_type_is_decoded_as_before() -> None:
+    degiro = client({"offset": 0, "products": [{"id": "1", "name": "Product"}]})
+
+    assert degiro.get_stock_list(1, 2) == [{"id": "1", "name": "Product"}]
+
+
+def test_response_that_does_not_match_the_type_raises_its_validation_error() -> None:
+    degiro = client({"data": [{"id": "not a number", "productId": 2, "quantity": 3}]})
+
+    with pytest.raises(msgspec.ValidationError, match="Expected `int`"):
+        degiro.transactions(datetime.datetime(2026, 1, 1), datetime.datetime(2026, 1, 2), type_=Transaction)
+
+
+def test_response_that_is_no_json_raises_value_error() -> None:
+    degiro = client(b"")
+
+    with pytest.raises(ValueError, match="No data was returned."):
+        degiro.transactions(datetime.datetime(2026, 1, 1), datetime.datetime(2026, 1, 2), type_=Transaction)